@@ -99,6 +99,7 @@ class Config:
         
                               
         self.concurrent_requests = int(os.getenv("CONCURRENT_REQUESTS", "5"))
+        self.extraction_requests_per_second = float(os.getenv("EXTRACTION_REQUESTS_PER_SECOND", "2.0"))
         self.batch_size = int(os.getenv("BATCH_SIZE", "10"))
     
     def _get_news_sources(self) -> List[str]:
@@ -161,6 +162,9 @@ class Config:
         if self.concurrent_requests < 1:
             raise ValueError("Concurrent requests must be at least 1")
         
+        if self.extraction_requests_per_second < 0:
+            raise ValueError("Extraction requests per second must be at least 0 (0 = unlimited)")
+        
         return True
     
     def get_storage_path(self, filename: str) -> Path:
@@ -4,6 +4,8 @@ Language Configuration for AI Trend Tracker
 Supports English and Danish languages
 """
 
+from functools import lru_cache
+
 LANGUAGES = {
     'en': {
                    
@@ -489,104 +491,100 @@ def t(key):
     lang = get_language()
     return LANGUAGES[lang].get(key, key)
 
-def translate_ai_topic(topic: str) -> str:
-    """Translate AI topic from English to current language"""
-    if not topic:
-        return t('other')
-    
-    topic_lower = topic.lower()
-    if topic_lower in ['unknown', 'unknown topic', 'other', 'none', 'null']:
-        return t('other')
-    
-                                                        
-    topic_mapping = {
-        'AI Research and Development': 'ai_research_development',
-        'AI Ethics and Regulations': 'ai_ethics_regulations',
-        'AI Safety and Governance': 'ai_safety_governance',
-        'AI Business and Industry': 'ai_business_industry',
-        'AI Language Models and NLP': 'ai_language_models_nlp',
-        'AI Robotics and Automation': 'ai_robotics_automation',
-        'AI Healthcare and Medical': 'ai_healthcare_medical',
-        'AI Education and Training': 'ai_education_training',
-        'AI Cybersecurity and Privacy': 'ai_cybersecurity_privacy',
-        'AI Computer Vision': 'ai_computer_vision',
-        'AI Data Science and Analytics': 'ai_data_science_analytics',
-        'AI Neural Networks and Deep Learning': 'ai_neural_networks_deep_learning',
-        'AI Applications and Deployment': 'ai_applications_deployment',
-        'AI Technology and Infrastructure': 'ai_technology_infrastructure'
-    }
-    
-    translation_key = topic_mapping.get(topic, 'other')
-    return t(translation_key)
+_AI_TOPIC_KEYS = {
+    'AI Research and Development': 'ai_research_development',
+    'AI Ethics and Regulations': 'ai_ethics_regulations',
+    'AI Safety and Governance': 'ai_safety_governance',
+    'AI Business and Industry': 'ai_business_industry',
+    'AI Language Models and NLP': 'ai_language_models_nlp',
+    'AI Robotics and Automation': 'ai_robotics_automation',
+    'AI Healthcare and Medical': 'ai_healthcare_medical',
+    'AI Education and Training': 'ai_education_training',
+    'AI Cybersecurity and Privacy': 'ai_cybersecurity_privacy',
+    'AI Computer Vision': 'ai_computer_vision',
+    'AI Data Science and Analytics': 'ai_data_science_analytics',
+    'AI Neural Networks and Deep Learning': 'ai_neural_networks_deep_learning',
+    'AI Applications and Deployment': 'ai_applications_deployment',
+    'AI Technology and Infrastructure': 'ai_technology_infrastructure'
+}
 
-def translate_domain_category(category: str) -> str:
-    """Translate domain category from English to current language"""
+_DOMAIN_CATEGORY_KEYS = {
+    'advertising and commercial': 'advertising_commercial',
+    'journalism, news and media': 'journalism_news_media',
+    'digital media and content creation': 'digital_media_content_creation',
+    'strategic communication and pr': 'strategic_communication_pr',
+    'photography': 'photography',
+    'web and ux design': 'web_ux_design',
+    'film and tv production': 'film_tv_production',
+    'other': 'other',
+    'unknown': 'unknown'
+}
+
+_DAY_KEYS = {
+    'Monday': 'monday',
+    'Tuesday': 'tuesday',
+    'Wednesday': 'wednesday',
+    'Thursday': 'thursday',
+    'Friday': 'friday',
+    'Saturday': 'saturday',
+    'Sunday': 'sunday'
+}
+
+_MONTH_KEYS = {
+    'January': 'january',
+    'February': 'february',
+    'March': 'march',
+    'April': 'april',
+    'May': 'may',
+    'June': 'june',
+    'July': 'july',
+    'August': 'august',
+    'September': 'september',
+    'October': 'october',
+    'November': 'november',
+    'December': 'december'
+}
+
+_WEEK_KEYS = {
+    'Week 1': 'week_1',
+    'Week 2': 'week_2',
+    'Week 3': 'week_3',
+    'Week 4': 'week_4'
+}
+
+@lru_cache(maxsize=512)
+def _ai_topic_key(topic: str) -> str:
+    """Resolve an AI topic to its translation key"""
+    if not topic or topic.lower() in ('unknown', 'unknown topic', 'other', 'none', 'null'):
+        return 'other'
+    return _AI_TOPIC_KEYS.get(topic, 'other')
+
+@lru_cache(maxsize=512)
+def _domain_category_key(category: str) -> str:
+    """Resolve a domain category to its translation key"""
     if not category:
-        return t('other')
-    
-                                                                
-    category_mapping = {
-        'advertising and commercial': 'advertising_commercial',
-        'journalism, news and media': 'journalism_news_media',
-        'digital media and content creation': 'digital_media_content_creation',
-        'strategic communication and pr': 'strategic_communication_pr',
-        'photography': 'photography',
-        'web and ux design': 'web_ux_design',
-        'film and tv production': 'film_tv_production',
-        'other': 'other',
-        'unknown': 'unknown'
-    }
-    
-                                        
+        return 'other'
     normalized_category = category.lower()
     if normalized_category == 'unknown':
         normalized_category = 'other'
-    translation_key = category_mapping.get(normalized_category, 'other')
-    return t(translation_key)
+    return _DOMAIN_CATEGORY_KEYS.get(normalized_category, 'other')
+
+def translate_ai_topic(topic: str) -> str:
+    """Translate AI topic from English to current language"""
+    return t(_ai_topic_key(topic))
+
+def translate_domain_category(category: str) -> str:
+    """Translate domain category from English to current language"""
+    return t(_domain_category_key(category))
 
 def translate_day_name(day_name: str) -> str:
     """Translate day name from English to current language"""
-    day_mapping = {
-        'Monday': 'monday',
-        'Tuesday': 'tuesday',
-        'Wednesday': 'wednesday',
-        'Thursday': 'thursday',
-        'Friday': 'friday',
-        'Saturday': 'saturday',
-        'Sunday': 'sunday'
-    }
-    
-    translation_key = day_mapping.get(day_name, day_name.lower())
-    return t(translation_key)
+    return t(_DAY_KEYS.get(day_name, day_name.lower()))
 
 def translate_month_name(month_name: str) -> str:
     """Translate month name from English to current language"""
-    month_mapping = {
-        'January': 'january',
-        'February': 'february',
-        'March': 'march',
-        'April': 'april',
-        'May': 'may',
-        'June': 'june',
-        'July': 'july',
-        'August': 'august',
-        'September': 'september',
-        'October': 'october',
-        'November': 'november',
-        'December': 'december'
-    }
-    
-    translation_key = month_mapping.get(month_name, month_name.lower())
-    return t(translation_key)
+    return t(_MONTH_KEYS.get(month_name, month_name.lower()))
 
 def translate_week_label(week_label: str) -> str:
     """Translate week label from English to current language"""
-    week_mapping = {
-        'Week 1': 'week_1',
-        'Week 2': 'week_2',
-        'Week 3': 'week_3',
-        'Week 4': 'week_4'
-    }
-    
-    translation_key = week_mapping.get(week_label, week_label.lower().replace(' ', '_'))
-    return t(translation_key)
+    return t(_WEEK_KEYS.get(week_label, week_label.lower().replace(' ', '_')))
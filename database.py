@@ -4,13 +4,15 @@ import sqlite3
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Iterable, Optional, Set
 from dataclasses import dataclass, asdict
 
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+_URL_LOOKUP_CHUNK_SIZE = 400
+
 
 @dataclass
 class ProcessedArticle:
@@ -121,6 +123,7 @@ class ArticleDatabase:
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_processed_at ON processed_articles(processed_at)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_domain ON processed_articles(domain)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_language ON processed_articles(language)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_ai_processed_at ON processed_articles(ai_topic_detected, processed_at)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_rejected_at ON rejected_articles(rejected_at)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_rejected_domain ON rejected_articles(domain)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_rejected_language ON rejected_articles(language)')
@@ -178,6 +181,30 @@ class ArticleDatabase:
             logger.error(f"Failed to get processed URLs: {e}")
             return set()
     
+    def get_existing_urls(self, urls: Iterable[str]) -> Set[str]:
+        """Get the subset of ``urls`` already stored as processed or rejected articles.
+        
+        Only the given URLs are looked up, in primary-key ``IN`` queries of
+        ``_URL_LOOKUP_CHUNK_SIZE``, so the full URL history is never loaded.
+        """
+        url_list = list({url for url in urls if url})
+        existing: Set[str] = set()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                for start in range(0, len(url_list), _URL_LOOKUP_CHUNK_SIZE):
+                    chunk = url_list[start:start + _URL_LOOKUP_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor.execute(
+                        f'SELECT url FROM processed_articles WHERE url IN ({placeholders}) '
+                        f'UNION SELECT url FROM rejected_articles WHERE url IN ({placeholders})',
+                        chunk + chunk
+                    )
+                    existing.update(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            logger.error(f"Failed to look up existing URLs: {e}")
+        return existing
+    
     def get_processed_domain_title_pairs(self) -> List[tuple]:
         """Get (domain, title) for every stored article, for cross-run deduplication.
 
@@ -279,8 +306,13 @@ class ArticleDatabase:
         except Exception as e:
             logger.error(f"Failed to add processed articles: {e}")
     
-    def add_rejected_articles(self, articles: List[Dict[str, Any]], file_stored_in: str):
-        """Add rejected articles to database for deduplication."""
+    def add_rejected_articles(self, articles: List[Any], file_stored_in: str):
+        """Add rejected articles to database for deduplication.
+        
+        Args:
+            articles: processor.RejectedArticle entries (article dict and reason)
+            file_stored_in: Path of the JSON file the articles were written to
+        """
         if not articles:
             return
         
@@ -288,7 +320,7 @@ class ArticleDatabase:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
-                for article in articles:
+                for article, rejection_reason in articles:
                     cursor.execute('''
                         INSERT OR REPLACE INTO rejected_articles 
                         (url, title, domain, domain_category, language, source_country, rejected_at, 
@@ -304,7 +336,7 @@ class ArticleDatabase:
                         article.get('date_download', ''),
                         article.get('gdelt_id', ''),
                         article.get('extraction_method', ''),
-                        article.get('rejection_reason', 'unknown'),
+                        rejection_reason or 'unknown',
                         file_stored_in
                     ))
                 
@@ -503,6 +535,22 @@ class ArticleDatabase:
             logger.error(f"Failed to get AI article count: {e}")
             return 0
     
+    def get_ai_articles_version(self) -> str:
+        """Get a token that changes whenever AI-related articles are added or replaced."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT COUNT(*), MAX(processed_at)
+                    FROM processed_articles
+                    WHERE ai_topic_detected = 1
+                """)
+                count, latest = cursor.fetchone()
+                return f"{count}:{latest}"
+        except Exception as e:
+            logger.error(f"Failed to get AI articles version: {e}")
+            return ""
+    
     def get_ai_articles_by_domain_category(self) -> Dict[str, int]:
         """Get count of AI-related articles by domain category."""
         try:
@@ -1,9 +1,17 @@
 """News fetcher module for processing GDELT news data."""
 
+import queue
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Set
+from typing import List, Dict, Optional, Any, Set, Deque, Tuple, Iterator
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urlparse
 
@@ -14,7 +22,7 @@ sys.path.insert(0, str(project_root))
 
 from config import load_config
 from logger import get_logger
-from utils import format_duration, rate_limit
+from utils import TokenBucket, format_duration, generate_content_hash
 from database import get_database
 
                                                        
@@ -32,22 +40,42 @@ except ImportError:
 logger = get_logger(__name__)
 
                                 
+REASON_TEXT_EXTRACTION_FAILED = "text_extraction_failed"
+REASON_TEXT_TOO_SHORT = "text_too_short_before_processing"
+REASON_EXTRACTION_EXCEPTION = "extraction_exception"
+REASON_NO_VALID_ARTICLES = "no_valid_articles"
+REASON_NO_ARTICLES_FOUND = "no_articles_found"
+REASON_FETCH_ERROR = "fetch_error"
+
+
 class DomainFailureTracker:
     """Tracks domains that fail text extraction persistently across batches."""
     
-    def __init__(self, max_failures_per_domain: int = 5):
+    def __init__(self, max_failures_per_domain: int = 5, max_failure_details: int = 100):
         self.failed_domains: Set[str] = set()
         self.domain_failure_counts: Dict[str, int] = {}
-        self.batch_start_time = datetime.now()
+        self.domain_failure_reasons: Dict[str, str] = {}
+        self.recent_failure_details: Deque[Tuple[str, str, str]] = deque(maxlen=max_failure_details)
+        self.batch_start_time = time.perf_counter()
         self.max_failures_per_domain = max_failures_per_domain
-        
-    def mark_domain_failed(self, domain: str, failure_reason: str = "text_extraction_failed"):
-        """Mark a domain as failed for the current batch."""
-        if domain not in self.failed_domains:
-            self.domain_failure_counts[domain] = 1
-            logger.warning(f"Domain {domain} failure 1/{self.max_failures_per_domain}: {failure_reason}")
+        self._lock = threading.Lock()
+        
+    def mark_domain_failed(self, domain: str, failure_reason: str = REASON_TEXT_EXTRACTION_FAILED,
+                           detail: Optional[str] = None):
+        """Mark a domain as failed for the current batch.
+        
+        Args:
+            domain: Domain that failed
+            failure_reason: Short reason code (one of the REASON_* constants)
+            detail: Optional free-form detail, kept only in a bounded buffer
+        """
+        with self._lock:
+            self.domain_failure_counts[domain] = self.domain_failure_counts.get(domain, 0) + 1
+            self.domain_failure_reasons[domain] = failure_reason
+        if detail:
+            self.recent_failure_details.append((domain, failure_reason, detail))
+            logger.warning(f"Domain {domain} failure {self.domain_failure_counts[domain]}/{self.max_failures_per_domain}: {failure_reason}: {detail}")
         else:
-            self.domain_failure_counts[domain] += 1
             logger.warning(f"Domain {domain} failure {self.domain_failure_counts[domain]}/{self.max_failures_per_domain}: {failure_reason}")
         
                                                            
@@ -72,7 +100,9 @@ class DomainFailureTracker:
         return {
             'failed_domains': list(self.failed_domains),
             'failure_counts': self.domain_failure_counts.copy(),
-            'batch_duration': (datetime.now() - self.batch_start_time).total_seconds(),
+            'failure_reasons': self.domain_failure_reasons.copy(),
+            'recent_failure_details': list(self.recent_failure_details),
+            'batch_duration': time.perf_counter() - self.batch_start_time,
             'total_failures': len(self.failed_domains)
         }
     
@@ -100,6 +130,7 @@ def get_domain_failure_report() -> Dict[str, Any]:
     tracker = get_domain_failure_tracker()
     return tracker.get_failed_domains_report()
 
+@lru_cache(maxsize=4096)
 def normalize_domain_for_dedup(domain: str) -> str:
     """
     Normalize domain for duplicate detection by removing subdomains.
@@ -129,6 +160,57 @@ def normalize_domain_for_dedup(domain: str) -> str:
     return domain
 
 
+class ArticleDeduper:
+    """Streaming in-memory deduplication by URL, normalized domain+title and text.
+    
+    A single instance can be shared across several fetches so duplicates are
+    dropped as articles are parsed instead of in a separate pass afterwards.
+    Hashing the extracted text also catches the same wire story republished
+    by several sources under different URLs and titles.
+    """
+    
+    def __init__(self):
+        self.seen_urls: Set[str] = set()
+        self.seen_domain_title: Set[tuple] = set()
+        self.seen_text_hashes: Set[str] = set()
+        self.duplicates = 0
+    
+    def add(self, article: Dict[str, Any]) -> bool:
+        """Record an article, returning False if it duplicates one already seen."""
+        url = article.get('url', '')
+        if url and url in self.seen_urls:
+            self.duplicates += 1
+            return False
+        
+        domain_title_key = None
+        title = article.get('title', '').strip().lower()
+        domain = article.get('domain', '')
+        if domain and title:
+            normalized_domain = normalize_domain_for_dedup(domain)
+            domain_title_key = (normalized_domain, title)
+            if domain_title_key in self.seen_domain_title:
+                self.duplicates += 1
+                logger.debug(f"Duplicate detected: {normalized_domain} - '{title[:50]}...'")
+                return False
+        
+        text_hash = None
+        text = article.get('text')
+        if text:
+            text_hash = generate_content_hash(text)
+            if text_hash in self.seen_text_hashes:
+                self.duplicates += 1
+                logger.debug(f"Duplicate text detected: {url}")
+                return False
+        
+        if domain_title_key is not None:
+            self.seen_domain_title.add(domain_title_key)
+        if text_hash is not None:
+            self.seen_text_hashes.add(text_hash)
+        if url:
+            self.seen_urls.add(url)
+        return True
+
+
 def _domain_suffix_matches(candidate_domain: str, target_domain: str) -> bool:
     """Return True if candidate_domain is exactly target_domain (no subdomains)."""
     candidate = candidate_domain.lower()
@@ -142,11 +224,128 @@ def _domain_suffix_matches(candidate_domain: str, target_domain: str) -> bool:
 
 
 
+_REQUEST_TIMEOUT = 10
+_BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+_EXTRACTION_WORKERS = 8
+_MAX_RETRY_AFTER = 30
+
+
+class _CappedRetry(Retry):
+    """Retry policy that never waits longer than _MAX_RETRY_AFTER seconds for a Retry-After header."""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+def _create_http_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all article downloads.
+    
+    Connections are pooled and kept alive per host. Transient errors
+    (connection and read failures, 429 and 5xx responses) are retried up
+    to MAX_RETRIES times with exponential backoff starting at RETRY_DELAY,
+    honouring Retry-After up to _MAX_RETRY_AFTER seconds. Permanent errors such as 404 and 410 fail
+    immediately.
+    
+    Returns:
+        requests.Session: Session with a retrying, pooled adapter mounted
+    """
+    config = load_config()
+    session = requests.Session()
+    session.headers['User-Agent'] = _BROWSER_USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=2 * _EXTRACTION_WORKERS,
+        max_retries=_CappedRetry(
+            total=config.max_retries,
+            connect=config.max_retries,
+            read=config.max_retries,
+            status=config.max_retries,
+            backoff_factor=config.retry_delay,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({'GET'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_http_session = _create_http_session()
+
+_host_buckets: Dict[str, TokenBucket] = {}
+_host_buckets_lock = threading.Lock()
+
+
+def _acquire_host_slot(url: str) -> None:
+    """
+    Wait for the per-host rate limit before requesting url.
+    
+    Each host gets a token bucket refilled at EXTRACTION_REQUESTS_PER_SECOND
+    that allows bursts of one request per extraction worker. A rate of 0
+    turns the limit off.
+    
+    Args:
+        url: URL about to be requested
+    """
+    rate = load_config().extraction_requests_per_second
+    if rate <= 0:
+        return
+    host = urlparse(url).netloc.lower()
+    bucket = _host_buckets.get(host)
+    if bucket is None:
+        with _host_buckets_lock:
+            bucket = _host_buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(rate, _EXTRACTION_WORKERS)
+                _host_buckets[host] = bucket
+    waited = bucket.acquire()
+    if waited > 0:
+        logger.debug(f"Rate limited {host} for {waited:.2f}s")
+
+
+def _download_html(url: str, domain: str) -> Optional[str]:
+    """
+    Download a page once so every extractor can work on the same HTML.
+    
+    When the Content-Type header names no charset, the encoding is detected
+    from the body instead of falling back to ISO-8859-1.
+    
+    Args:
+        url: Article URL
+        domain: Domain name for logging
+        
+    Returns:
+        Page HTML, or None if the download failed
+    """
+    try:
+        _acquire_host_slot(url)
+        response = _http_session.get(url, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except Exception as e:
+        logger.debug(f"Could not download content from {domain}: {e}")
+        return None
+    
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = response.apparent_encoding
+    
+    try:
+        return response.text or response.content.decode('utf-8', errors='ignore')
+    except (TypeError, UnicodeDecodeError):
+        return response.content.decode('utf-8', errors='ignore')
+
+
 def _extract_text_advanced(url: str, domain: str) -> Optional[str]:
     """
     Advanced text extraction using multiple specialized libraries with proper encoding handling.
     
-    Tries multiple extraction methods in order of sophistication:
+    The page is downloaded once through the shared session, then handed to
+    multiple extraction methods in order of sophistication:
     1. Trafilatura (fast general extraction - PRIORITY)
     2. Goose3 (news-specific extraction fallback) 
     3. Newspaper3k (reliable, news-specific fallback)
@@ -199,40 +398,25 @@ def _extract_text_advanced(url: str, domain: str) -> Optional[str]:
         return text
     
                                                                 
+    html = _download_html(url, domain)
+    if html is None:
+        return None
+    
+                                                                
     try:
         import trafilatura
-        import logging
         
-                                                                                   
-        trafilatura_logger = logging.getLogger('trafilatura.downloads')
-        original_level = trafilatura_logger.level
-        trafilatura_logger.setLevel(logging.CRITICAL)                                                     
-        
-        try:
-                                                             
-            if not url or not url.startswith(('http://', 'https://')):
-                logger.debug(f"Invalid URL format: {url}")
-                return None
-                
-                                                       
-            downloaded = trafilatura.fetch_url(url)
-            if downloaded:
-                                            
-                text = trafilatura.extract(downloaded, 
-                                        include_comments=False, 
-                                        include_tables=False,
-                                        include_formatting=False)
-                if text and len(text.strip()) > 200:
-                    text = _fix_encoding(text.strip())
-                    logger.info(f"✓ TRAFILATURA extracted {len(text)} chars from {domain}")
-                    return text
-                else:
-                    logger.debug(f"Trafilatura extracted insufficient text from {domain} ({len(text) if text else 0} chars)")
-            else:
-                logger.debug(f"Trafilatura could not download content from {domain} (404 or network error)")
-        finally:
-                                            
-            trafilatura_logger.setLevel(original_level)
+        text = trafilatura.extract(html,
+                                   url=url,
+                                   include_comments=False,
+                                   include_tables=False,
+                                   include_formatting=False)
+        if text and len(text.strip()) > 200:
+            text = _fix_encoding(text.strip())
+            logger.info(f"✓ TRAFILATURA extracted {len(text)} chars from {domain}")
+            return text
+        else:
+            logger.debug(f"Trafilatura extracted insufficient text from {domain} ({len(text) if text else 0} chars)")
             
     except Exception as e:
         logger.debug(f"Trafilatura extraction failed for {domain}: {e}")
@@ -242,7 +426,7 @@ def _extract_text_advanced(url: str, domain: str) -> Optional[str]:
         from goose3 import Goose
         
         g = Goose()
-        article = g.extract(url=url)
+        article = g.extract(url=url, raw_html=html)
         
         if article.cleaned_text and len(article.cleaned_text.strip()) > 200:
             text = _fix_encoding(article.cleaned_text.strip())
@@ -256,7 +440,7 @@ def _extract_text_advanced(url: str, domain: str) -> Optional[str]:
         from newspaper import Article
         
         article = Article(url)
-        article.download()
+        article.download(input_html=html)
         article.parse()
         
         if article.text and len(article.text.strip()) > 200:
@@ -269,51 +453,21 @@ def _extract_text_advanced(url: str, domain: str) -> Optional[str]:
                                                   
     try:
         from readability import Document
-        import requests
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        from bs4 import BeautifulSoup
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        doc = Document(html)
+        soup = BeautifulSoup(doc.summary(), 'html.parser')
+        text = soup.get_text(strip=True)
         
-                                                               
-        try:
-                                                   
-            if hasattr(response, 'text') and response.text:
-                content = response.text
-            else:
-                                            
-                content = response.content.decode('utf-8', errors='ignore')
-            
-            doc = Document(content)
-            
-                                                
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(doc.summary(), 'html.parser')
-            text = soup.get_text(strip=True)
-            
-            if text and len(text.strip()) > 200:
-                text = _fix_encoding(text.strip())
-                logger.info(f"✓ READABILITY extracted {len(text)} chars from {domain}")
-                return text
-        except (TypeError, UnicodeDecodeError) as encoding_error:
-            logger.debug(f"Readability encoding error for {domain}: {encoding_error}")
-                                                 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-            text = soup.get_text(strip=True)
-            
-            if text and len(text.strip()) > 200:
-                text = _fix_encoding(text.strip())
-                logger.info(f"✓ READABILITY fallback extracted {len(text)} chars from {domain}")
-                return text
+        if text and len(text.strip()) > 200:
+            text = _fix_encoding(text.strip())
+            logger.info(f"✓ READABILITY extracted {len(text)} chars from {domain}")
+            return text
     except Exception as e:
         logger.debug(f"Readability extraction failed for {domain}: {e}")
     
                                                         
-    return _extract_text_fallback(url, domain)
+    return _extract_text_fallback(url, domain, html)
 
 
 def _extract_deadline_title(url: str) -> Optional[str]:
@@ -327,14 +481,9 @@ def _extract_deadline_title(url: str) -> Optional[str]:
         Extracted title or None if extraction fails
     """
     try:
-        import requests
         from bs4 import BeautifulSoup
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _http_session.get(url, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
         
         soup = BeautifulSoup(response.content, 'html.parser')
@@ -368,13 +517,14 @@ def _extract_deadline_title(url: str) -> Optional[str]:
         return None
 
 
-def _extract_text_fallback(url: str, domain: str) -> Optional[str]:
+def _extract_text_fallback(url: str, domain: str, html: Optional[str] = None) -> Optional[str]:
     """
     Text extraction using requests and BeautifulSoup (fallback method).
     
     Args:
         url: Article URL
         domain: Domain name for logging
+        html: Already downloaded page HTML; downloaded when omitted
         
     Returns:
         Extracted text or None if failed
@@ -387,14 +537,12 @@ def _extract_text_fallback(url: str, domain: str) -> Optional[str]:
         return None
         
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        if html is None:
+            html = _download_html(url, domain)
+            if html is None:
+                return None
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser')
         
                                           
         for script in soup(["script", "style"]):
@@ -488,14 +636,9 @@ def _extract_journalisten_specific_article(url: str, domain: str) -> Optional[st
             return None
 
                                  
-        import requests
         from bs4 import BeautifulSoup
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _http_session.get(url, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
         
                         
@@ -789,6 +932,50 @@ def get_domain_category(domain: str) -> str:
                                           
     return 'Other'
 
+@dataclass(slots=True)
+class FetchedArticle:
+    """Article parsed from a GDELT result row, before pipeline processing."""
+    url: str
+    title: str
+    text: str
+    domain: str
+    domain_category: str
+    language: str
+    date_publish: str
+    date_download: str
+    source: str
+    sourcecountry: str
+    gdelt_id: str
+    extraction_method: str
+    authors: List[str] = field(default_factory=list)
+    description: str = ''
+    image: str = ''
+    fetch_source: str = 'gdelt'
+    gdelt_metadata: bool = True
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary format used by the rest of the pipeline."""
+        return {
+            'url': self.url,
+            'title': self.title,
+            'text': self.text,
+            'domain': self.domain,
+            'domain_category': self.domain_category,
+            'language': self.language,
+            'date_publish': self.date_publish,
+            'date_download': self.date_download,
+            'authors': self.authors,
+            'description': self.description,
+            'image': self.image,
+            'source': self.source,
+            'sourcecountry': self.sourcecountry,
+            'gdelt_id': self.gdelt_id,
+            'extraction_method': self.extraction_method,
+            'fetch_source': self.fetch_source,
+            'gdelt_metadata': self.gdelt_metadata,
+        }
+
+
 class FetcherError(Exception):
     """Base exception for fetcher operations."""
     pass
@@ -814,13 +1001,127 @@ def get_last_processed_timestamp() -> Optional[str]:
         logger.warning(f"Failed to get last processed timestamp: {e}")
         return None
 
-def fetch_by_domains(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
+def _prefetch_gdelt_searches(gd, domains: List[str],
+                             min_interval: float = 1.0) -> Iterator[Tuple[str, Any, Optional[Exception], float]]:
+    """
+    Run GDELT domain searches in a background thread, one domain ahead.
+    
+    The next domain's query overlaps with extraction of the current domain's
+    articles. Queries are still spaced at least min_interval seconds apart.
+    
+    Args:
+        gd: GdeltDoc client
+        domains: Domains to search, in order
+        min_interval: Minimum number of seconds between two GDELT requests
+        
+    Yields:
+        Tuple of (domain, DataFrame or None, exception or None, API duration in seconds)
+    """
+    results: queue.Queue = queue.Queue(maxsize=2)
+    stop_event = threading.Event()
+    
+    def _put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                results.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _worker():
+        last_request = None
+        for domain in domains:
+            if last_request is not None:
+                wait = min_interval - (time.perf_counter() - last_request)
+                if wait > 0 and stop_event.wait(wait):
+                    return
+            if stop_event.is_set():
+                return
+            last_request = time.perf_counter()
+            
+            df, error = None, None
+            try:
+                now = datetime.utcnow()
+                filters = gdeltdoc.Filters(
+                    domain=domain,
+                    start_date=now - timedelta(hours=2),
+                    end_date=now
+                )
+                df = gd.article_search(filters)
+            except Exception as e:
+                error = e
+            
+            if not _put((domain, df, error, time.perf_counter() - last_request)):
+                return
+        _put(None)
+    
+    thread = threading.Thread(target=_worker, name="gdelt-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = results.get()
+            if item is None:
+                break
+            yield item
+    finally:
+        stop_event.set()
+
+
+                                                                   
+_extraction_pool = ThreadPoolExecutor(max_workers=_EXTRACTION_WORKERS, thread_name_prefix="article-extract")
+
+
+def _parse_rows_concurrently(rows: List[Dict[str, Any]], processed_urls: Set[str] = None,
+                             skip_cache: Optional[Dict[str, bool]] = None,
+                             label: str = "GDELT article") -> Iterator[Tuple[Optional[FetchedArticle], Optional[Exception]]]:
+    """
+    Parse GDELT result rows on the extraction pool, yielding results in row order.
+    
+    Full-text extraction is dominated by network waits, so several rows of a
+    domain are downloaded and extracted at once.
+    
+    Args:
+        rows: Records from a gdeltdoc result DataFrame
+        processed_urls: Extra URLs to skip; URLs already stored in the database
+            are looked up for the whole result set and always skipped
+        skip_cache: Per-batch cache of domain skip decisions, keyed by URL domain
+        label: Article description used in progress logs
+        
+    Yields:
+        Tuple of (parsed article or None, exception raised while parsing or None)
+    """
+    total = len(rows)
+    date_download = datetime.now(timezone.utc).isoformat()
+    
+    row_urls = [row.get('url', '') for row in rows]
+    try:
+        known_urls = get_database().get_existing_urls(row_urls)
+    except Exception as e:
+        logger.warning(f"Failed to look up processed URLs, continuing without duplicate checking: {e}")
+        known_urls = set()
+    if processed_urls:
+        known_urls.update(url for url in row_urls if url in processed_urls)
+    
+    def _parse(indexed_row):
+        index, row = indexed_row
+        logger.info(f"   📄 [{index}/{total}] Extracting {label} {index}...")
+        try:
+            return _parse_gdeltdoc_dataframe_row(row, known_urls, skip_cache, date_download), None
+        except Exception as e:
+            return None, e
+    
+    return _extraction_pool.map(_parse, enumerate(rows, 1))
+
+
+def fetch_by_domains(processed_urls: Set[str] = None, deduper: Optional[ArticleDeduper] = None) -> List[Dict[str, Any]]:
     """
     Fetch all available news from major domains using GDELT only.
     Always operates in unlimited mode for the past 2 hours.
     
     Args:
         processed_urls: Set of already processed URLs to skip duplicates
+        deduper: Shared deduplicator; a fresh one is used when omitted
         
     Returns:
         List[Dict]: List of extracted article dictionaries from major domains
@@ -829,6 +1130,10 @@ def fetch_by_domains(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
     
     all_articles = []
     tracker = get_domain_failure_tracker()
+    skip_cache: Dict[str, bool] = {}
+    if deduper is None:
+        deduper = ArticleDeduper()
+    duplicates_before = deduper.duplicates
     
     try:
                                                                               
@@ -840,27 +1145,24 @@ def fetch_by_domains(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
         if gdeltdoc and gdelt_domains:
             gd = gdeltdoc.GdeltDoc()
             
+            pending_domains = []
             for domain in gdelt_domains:
+                if _should_skip_domain(tracker, domain, skip_cache):
+                    logger.info(f"⏭️  Skipping failed GDELT domain '{domain}' (failure count: {tracker.get_domain_failure_count(domain)})")
+                else:
+                    pending_domains.append(domain)
+            
+            for domain, df, search_error, api_duration in _prefetch_gdelt_searches(gd, pending_domains):
                 try:
                     
                                                         
-                    if tracker.should_skip_domain(domain):
+                    if _should_skip_domain(tracker, domain, skip_cache):
                         logger.info(f"⏭️  Skipping failed GDELT domain '{domain}' (failure count: {tracker.get_domain_failure_count(domain)})")
                         continue
                     
                     logger.info(f"🔍 Searching GDELT domain '{domain}' for articles (last 2 hours)")
-                    
-                                                                                           
-                    now = datetime.utcnow()
-                    two_hours_ago = now - timedelta(hours=2)
-                    
-                    filters = gdeltdoc.Filters(
-                        domain=domain,
-                        start_date=two_hours_ago,
-                        end_date=now
-                    )
-                    
-                    df = gd.article_search(filters)
+                    if search_error is not None:
+                        raise search_error
                     
                     if df is not None and not df.empty:
                         logger.info(f"✅ Found {len(df)} articles from GDELT domain {domain}")
@@ -868,18 +1170,20 @@ def fetch_by_domains(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
                         domain_counter = 0
                         articles_from_domain = 0
                         
-                        for _, row in df.iterrows():
+                        for parsed, parse_error in _parse_rows_concurrently(df.to_dict('records'), processed_urls, skip_cache,
+                                                                            f"GDELT article from {domain}"):
                             try:
                                 domain_counter += 1
-                                logger.info(f"   📄 [{domain_counter}/{len(df)}] Extracting GDELT article {domain_counter} from {domain}...")
-                                article = _parse_gdeltdoc_dataframe_row(row, processed_urls)
-                                if article:
-                                                               
-                                    article['fetch_source'] = 'gdelt'
-                                    article['gdelt_metadata'] = True
-                                    all_articles.append(article)
+                                if parse_error is not None:
+                                    raise parse_error
+                                if parsed:
+                                    article = parsed.to_dict()
                                     articles_from_domain += 1
-                                    logger.info(f"   ✅ GDELT article {domain_counter} extracted successfully")
+                                    if deduper.add(article):
+                                        all_articles.append(article)
+                                        logger.info(f"   ✅ GDELT article {domain_counter} extracted successfully")
+                                    else:
+                                        logger.info(f"   ⏭️  GDELT article {domain_counter} is a duplicate (skipped)")
                                 else:
                                     logger.info(f"   ❌ GDELT article {domain_counter} failed extraction (filtered out)")
                             except Exception as e:
@@ -891,56 +1195,55 @@ def fetch_by_domains(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
                             logger.info(f"✅ GDELT domain {domain} working well: {articles_from_domain} articles extracted")
                         else:
                                                                     
-                            tracker.mark_domain_failed(domain, "no_valid_articles")
+                            _mark_domain_failed(tracker, domain, REASON_NO_VALID_ARTICLES, skip_cache)
                             logger.warning(f"⚠️  GDELT domain {domain} marked as failed: no valid articles extracted")
                             
                     else:
                         logger.info(f"❌ No articles found from GDELT domain {domain}")
                                                               
-                        tracker.mark_domain_failed(domain, "no_articles_found")
-                    
-                                                             
-                        
-                                                    
-                    time.sleep(1)
+                        _mark_domain_failed(tracker, domain, REASON_NO_ARTICLES_FOUND, skip_cache)
                     
                 except Exception as e:
                     logger.warning(f"❌ Error fetching from GDELT domain {domain}: {e}")
                                            
-                    tracker.mark_domain_failed(domain, f"fetch_error: {str(e)}")
+                    _mark_domain_failed(tracker, domain, REASON_FETCH_ERROR, skip_cache, detail=str(e))
                     continue
         
         
                             
-        logger.info(f"🔄 Removing duplicates from {len(all_articles)} articles...")
-        unique_articles = _remove_duplicate_articles(all_articles)
+        logger.info(f"Removed {deduper.duplicates - duplicates_before} in-memory duplicate articles")
         
-        logger.info(f"✅ GDELT fetch completed: {len(unique_articles)} articles")
-        logger.info(f"📊 GDELT articles: {len([a for a in unique_articles if a.get('fetch_source') == 'gdelt'])}")
+        logger.info(f"✅ GDELT fetch completed: {len(all_articles)} articles")
+        logger.info(f"📊 GDELT articles: {len([a for a in all_articles if a.get('fetch_source') == 'gdelt'])}")
         
-        return unique_articles
+        return all_articles
         
     except Exception as e:
         logger.error(f"Error in GDELT fetch: {e}")
         return []
 
 
-def fetch_danish_news(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
+def fetch_danish_news(processed_urls: Set[str] = None, deduper: Optional[ArticleDeduper] = None) -> List[Dict[str, Any]]:
     """
     Fetch all available Danish news using GDELT only.
     Always operates in unlimited mode for the past 2 hours.
     
     Args:
         processed_urls: Set of already processed URLs to skip duplicates
+        deduper: Shared deduplicator; a fresh one is used when omitted
         
     Returns:
         List[Dict]: List of extracted article dictionaries from Danish domains
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     logger.info("🚀 Starting unlimited Danish news fetch (past 2 hours)")
     
     all_articles = []
     tracker = get_domain_failure_tracker()
+    skip_cache: Dict[str, bool] = {}
+    if deduper is None:
+        deduper = ArticleDeduper()
+    duplicates_before = deduper.duplicates
     
     try:
                                                                              
@@ -953,33 +1256,27 @@ def fetch_danish_news(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
             logger.info("📡 Initializing GDELT DOC client...")
             gd = gdeltdoc.GdeltDoc()
             
-            domain_count = 0
+            pending_domains = []
             for domain in gdelt_danish_domains:
+                if _should_skip_domain(tracker, domain, skip_cache):
+                    logger.info(f"⏭️  Skipping GDELT Danish domain '{domain}' - already marked as failed ({tracker.get_domain_failure_count(domain)} failures)")
+                else:
+                    pending_domains.append(domain)
+            
+            domain_count = 0
+            for domain, df, search_error, api_duration in _prefetch_gdelt_searches(gd, pending_domains):
                 domain_count += 1
-                domain_start_time = datetime.now()
+                domain_start_time = time.perf_counter()
                 
                                                              
-                if tracker.should_skip_domain(domain):
-                    logger.info(f"⏭️  [{domain_count}/{len(gdelt_danish_domains)}] Skipping GDELT Danish domain '{domain}' - already marked as failed ({tracker.get_domain_failure_count(domain)} failures)")
+                if _should_skip_domain(tracker, domain, skip_cache):
+                    logger.info(f"⏭️  [{domain_count}/{len(pending_domains)}] Skipping GDELT Danish domain '{domain}' - already marked as failed ({tracker.get_domain_failure_count(domain)} failures)")
                     continue
                     
                 try:
-                    logger.info(f"🔍 [{domain_count}/{len(gdelt_danish_domains)}] Processing GDELT Danish domain '{domain}'...")
-                    logger.info(f"📡 Making GDELT API request for {domain}...")
-                    
-                                                                                           
-                    now = datetime.utcnow()
-                    two_hours_ago = now - timedelta(hours=2)
-                    
-                    filters = gdeltdoc.Filters(
-                        domain=domain,
-                        start_date=two_hours_ago,
-                        end_date=now
-                    )
-                    
-                    api_start_time = datetime.now()
-                    df = gd.article_search(filters)
-                    api_duration = (datetime.now() - api_start_time).total_seconds()
+                    logger.info(f"🔍 [{domain_count}/{len(pending_domains)}] Processing GDELT Danish domain '{domain}'...")
+                    if search_error is not None:
+                        raise search_error
                     
                     logger.info(f"⏱️  API request completed in {api_duration:.2f}s")
                     
@@ -991,19 +1288,17 @@ def fetch_danish_news(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
                                                                                   
                             
                         logger.info(f"   📊 GDELT Danish domain {domain}: can fetch articles (no per-domain limit)")
-                        extraction_start_time = datetime.now()
+                        extraction_start_time = time.perf_counter()
                         
-                        for _, row in df.iterrows():
+                        for parsed, parse_error in _parse_rows_concurrently(df.to_dict('records'), processed_urls, skip_cache,
+                                                                            "GDELT Danish article"):
                                 
                             article_count += 1
                             try:
-                                logger.info(f"   📄 [{article_count}/{len(df)}] Extracting GDELT Danish article {article_count}...")
-                                article = _parse_gdeltdoc_dataframe_row(row, processed_urls)
-                                if article:                                                           
-                                                               
-                                    article['fetch_source'] = 'gdelt'
-                                    article['gdelt_metadata'] = True
-                                    domain_articles.append(article)
+                                if parse_error is not None:
+                                    raise parse_error
+                                if parsed:
+                                    domain_articles.append(parsed.to_dict())
                                     logger.info(f"   ✅ GDELT Danish article {article_count} extracted successfully")
                                     
                                 else:
@@ -1012,15 +1307,15 @@ def fetch_danish_news(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
                                 logger.debug(f"   ❌ Failed to parse GDELT Danish article {article_count} from {domain}: {e}")
                                 continue
                         
-                        extraction_duration = (datetime.now() - extraction_start_time).total_seconds()
+                        extraction_duration = time.perf_counter() - extraction_start_time
                         logger.info(f"   ⏱️  GDELT Danish article extraction completed in {extraction_duration:.2f}s")
                         
                                                                   
-                        if tracker.should_skip_domain(domain):
+                        if _should_skip_domain(tracker, domain, skip_cache):
                             logger.warning(f"   ⚠️  GDELT Danish domain {domain} failed during processing - discarding {len(domain_articles)} articles")
                                                                    
                         else:
-                            all_articles.extend(domain_articles)
+                            all_articles.extend(a for a in domain_articles if deduper.add(a))
                             logger.info(f"   ✅ Added {len(domain_articles)} GDELT Danish articles from {domain}")
                             
                                                                                     
@@ -1028,34 +1323,29 @@ def fetch_danish_news(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
                                 logger.info(f"✅ GDELT Danish domain {domain} working well: {len(domain_articles)} articles extracted")
                             else:
                                                                         
-                                tracker.mark_domain_failed(domain, "no_valid_articles")
+                                _mark_domain_failed(tracker, domain, REASON_NO_VALID_ARTICLES, skip_cache)
                                 logger.warning(f"⚠️  GDELT Danish domain {domain} marked as failed: no valid articles extracted")
                     else:
                         logger.info(f"   ❌ No articles found from GDELT Danish domain {domain}")
                                                               
-                        tracker.mark_domain_failed(domain, "no_articles_found")
+                        _mark_domain_failed(tracker, domain, REASON_NO_ARTICLES_FOUND, skip_cache)
                     
-                    domain_duration = (datetime.now() - domain_start_time).total_seconds()
+                    domain_duration = time.perf_counter() - domain_start_time
                     logger.info(f"   ⏱️  GDELT Danish domain {domain} completed in {domain_duration:.2f}s")
                     logger.info(f"   📊 Total Danish articles so far: {len(all_articles)}")
-                        
-                                                    
-                    logger.info(f"   ⏳ Rate limiting: waiting 1 second...")
-                    time.sleep(1)
                     
                 except Exception as e:
                     logger.warning(f"❌ Error fetching from GDELT Danish domain {domain}: {e}")
                                            
-                    tracker.mark_domain_failed(domain, f"fetch_error: {str(e)}")
+                    _mark_domain_failed(tracker, domain, REASON_FETCH_ERROR, skip_cache, detail=str(e))
                     continue
         
         
                                                         
-        logger.info(f"🔄 Removing duplicates from {len(all_articles)} Danish articles...")
-        unique_articles = _remove_duplicate_articles(all_articles)
-        final_articles = unique_articles
+        logger.info(f"Removed {deduper.duplicates - duplicates_before} in-memory duplicate articles")
+        final_articles = all_articles
         
-        total_duration = (datetime.now() - start_time).total_seconds()
+        total_duration = time.perf_counter() - start_time
         logger.info(f"✅ Danish news fetch COMPLETED in {total_duration:.2f}s")
         logger.info(f"📊 Final results: {len(final_articles)} Danish articles (after deduplication and failure handling)")
         logger.info(f"📊 GDELT Danish articles: {len([a for a in final_articles if a.get('fetch_source') == 'gdelt'])}")
@@ -1068,18 +1358,41 @@ def fetch_danish_news(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
         logger.error(f"Error fetching Danish news: {e}")
         return []
 
-def _parse_gdeltdoc_dataframe_row(row, processed_urls: Set[str] = None) -> Optional[Dict[str, Any]]:
+def _mark_domain_failed(tracker: DomainFailureTracker, domain: str, failure_reason: str,
+                        skip_cache: Optional[Dict[str, bool]] = None, detail: Optional[str] = None):
+    """Mark a domain as failed and refresh its cached skip decision."""
+    tracker.mark_domain_failed(domain, failure_reason, detail=detail)
+    if skip_cache is not None:
+        skip_cache[domain] = tracker.should_skip_domain(domain)
+
+
+def _should_skip_domain(tracker: DomainFailureTracker, domain: str,
+                        skip_cache: Optional[Dict[str, bool]] = None) -> bool:
+    """Check whether to skip a domain, consulting the per-batch cache first."""
+    if skip_cache is None:
+        return tracker.should_skip_domain(domain)
+    if domain not in skip_cache:
+        skip_cache[domain] = tracker.should_skip_domain(domain)
+    return skip_cache[domain]
+
+
+def _parse_gdeltdoc_dataframe_row(row, processed_urls: Set[str] = None,
+                                  skip_cache: Optional[Dict[str, bool]] = None,
+                                  date_download: Optional[str] = None) -> Optional[FetchedArticle]:
     """
     Parse gdeltdoc DataFrame row into pipeline-compatible format.
     
     Args:
-        row: Pandas DataFrame row from gdeltdoc library
+        row: Record (mapping) from a gdeltdoc result DataFrame
         processed_urls: Set of already processed URLs to skip duplicates
+        skip_cache: Per-batch cache of domain skip decisions, keyed by URL domain
+        date_download: ISO download timestamp shared by the rows of one search;
+            the current time is used when omitted
         
     Returns:
-        Dict: Article in pipeline format, or None if invalid
+        FetchedArticle: Parsed article, or None if invalid
     """
-    parse_start_time = datetime.now()
+    parse_start_time = time.perf_counter()
     try:
                                                 
         url = row.get('url', '')
@@ -1142,7 +1455,7 @@ def _parse_gdeltdoc_dataframe_row(row, processed_urls: Set[str] = None) -> Optio
             
                                                                         
             tracker = get_domain_failure_tracker()
-            if tracker.should_skip_domain(url_domain):
+            if _should_skip_domain(tracker, url_domain, skip_cache):
                 logger.debug(f"Skipping domain {url_domain} due to previous failures ({tracker.get_domain_failure_count(url_domain)} failures)")
                                                                         
                 return None
@@ -1156,22 +1469,22 @@ def _parse_gdeltdoc_dataframe_row(row, processed_urls: Set[str] = None) -> Optio
                 logger.info(f"Extracting full text from reliable domain {url_domain}: {url}")
                 
                                                                  
-                extraction_start_time = datetime.now()
+                extraction_start_time = time.perf_counter()
                 text = _extract_text_advanced(url, url_domain)
-                extraction_duration = (datetime.now() - extraction_start_time).total_seconds()
+                extraction_duration = time.perf_counter() - extraction_start_time
                 
                 if text:
                                                                                                            
                     if len(text) < 700:
                         logger.warning(f"Text too short before processing for {url_domain}: {len(text)} chars (minimum 700 required)")
-                        tracker.mark_domain_failed(url_domain, "text_too_short_before_processing")
+                        _mark_domain_failed(tracker, url_domain, REASON_TEXT_TOO_SHORT, skip_cache)
                         return None
                     
                     logger.info(f"✓ Successfully extracted {len(text)} characters from {url_domain} in {extraction_duration:.2f}s")
                 else:
                     logger.warning(f"Failed to extract text from {url_domain} after {extraction_duration:.2f}s")
                                                           
-                    tracker.mark_domain_failed(url_domain, "text_extraction_failed")
+                    _mark_domain_failed(tracker, url_domain, REASON_TEXT_EXTRACTION_FAILED, skip_cache)
                                                                             
                     return None
             else:
@@ -1182,7 +1495,7 @@ def _parse_gdeltdoc_dataframe_row(row, processed_urls: Set[str] = None) -> Optio
             logger.debug(f"✗ Failed to extract text from {url}: {e}")
                                                   
             tracker = get_domain_failure_tracker()
-            tracker.mark_domain_failed(url_domain, f"extraction_exception: {str(e)}")
+            _mark_domain_failed(tracker, url_domain, REASON_EXTRACTION_EXCEPTION, skip_cache, detail=str(e))
                                                                     
             return None
         
@@ -1202,7 +1515,7 @@ def _parse_gdeltdoc_dataframe_row(row, processed_urls: Set[str] = None) -> Optio
                                                     
         extraction_method = "basic_text_extraction"        
                                          
-        total_parse_duration = (datetime.now() - parse_start_time).total_seconds()
+        total_parse_duration = time.perf_counter() - parse_start_time
         logger.info(f"✅ Article parsing completed in {total_parse_duration:.2f}s")
         
                              
@@ -1216,23 +1529,20 @@ def _parse_gdeltdoc_dataframe_row(row, processed_urls: Set[str] = None) -> Optio
                 title = extracted_title
                 logger.info(f"✓ Extracted actual title from deadline.com: {title[:80]}...")
         
-        return {
-            'url': url,
-            'title': title,
-            'text': text,
-            'domain': article_domain,
-            'domain_category': domain_category,
-            'language': language,
-            'date_publish': seendate,
-            'date_download': datetime.now(timezone.utc).isoformat(),
-            'authors': [],                                         
-            'description': '',                                            
-            'image': '',                                                      
-            'source': domain,
-            'sourcecountry': sourcecountry,
-            'gdelt_id': url,
-            'extraction_method': extraction_method
-        }
+        return FetchedArticle(
+            url=url,
+            title=title,
+            text=text,
+            domain=article_domain,
+            domain_category=domain_category,
+            language=language,
+            date_publish=seendate,
+            date_download=date_download or datetime.now(timezone.utc).isoformat(),
+            source=domain,
+            sourcecountry=sourcecountry,
+            gdelt_id=url,
+            extraction_method=extraction_method
+        )
         
     except Exception as e:
         logger.debug(f"Error parsing gdeltdoc DataFrame row: {e}")
@@ -1267,15 +1577,6 @@ def fetch_gdelt_news_articles() -> List[Dict[str, Any]]:
     
     config = load_config()
     
-                                                         
-    try:
-        db = get_database()
-        processed_urls = db.get_processed_urls()
-        logger.info(f"Loaded {len(processed_urls)} processed URLs for duplicate checking")
-    except Exception as e:
-        logger.warning(f"Failed to load processed URLs, continuing without duplicate checking: {e}")
-        processed_urls = set()
-    
     try:
                                                                                     
         logger.info("🔄 Using unlimited fetch mode - fetching ALL available articles from past 2 hours")
@@ -1286,22 +1587,22 @@ def fetch_gdelt_news_articles() -> List[Dict[str, Any]]:
         return []
 
 
-def fetch_by_domains_unlimited(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
+def fetch_by_domains_unlimited(processed_urls: Set[str] = None, deduper: Optional[ArticleDeduper] = None) -> List[Dict[str, Any]]:
     """
     Fetch all available articles from major domains using GDELT only.
     Always operates in unlimited mode for the past 2 hours.
     """
     logger.info("🚀 Starting unlimited fetch from major domains (past 2 hours)")
-    return fetch_by_domains(processed_urls=processed_urls)
+    return fetch_by_domains(processed_urls=processed_urls, deduper=deduper)
 
 
-def fetch_danish_news_unlimited(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
+def fetch_danish_news_unlimited(processed_urls: Set[str] = None, deduper: Optional[ArticleDeduper] = None) -> List[Dict[str, Any]]:
     """
     Fetch all available Danish articles using GDELT only.
     Always operates in unlimited mode for the past 2 hours.
     """
     logger.info("🚀 Starting unlimited Danish news fetch (past 2 hours)")
-    return fetch_danish_news(processed_urls=processed_urls)
+    return fetch_danish_news(processed_urls=processed_urls, deduper=deduper)
 
 
 def fetch_gdelt_news_articles_unlimited(processed_urls: Set[str] = None) -> List[Dict[str, Any]]:
@@ -1311,22 +1612,17 @@ def fetch_gdelt_news_articles_unlimited(processed_urls: Set[str] = None) -> List
     """
     logger.info("🚀 Starting unlimited fetch from all domains (past 2 hours)")
     
-    all_articles = []
+    deduper = ArticleDeduper()
     
                            
-    danish_articles = fetch_danish_news_unlimited(processed_urls=processed_urls)
-    all_articles.extend(danish_articles)
-    logger.info(f"📊 Danish articles fetched: {len(danish_articles)}")
+    unique_articles = fetch_danish_news_unlimited(processed_urls=processed_urls, deduper=deduper)
+    logger.info(f"📊 Danish articles fetched: {len(unique_articles)}")
     
                               
-    english_articles = fetch_by_domains_unlimited(processed_urls=processed_urls)
-    all_articles.extend(english_articles)
+    english_articles = fetch_by_domains_unlimited(processed_urls=processed_urls, deduper=deduper)
+    unique_articles.extend(english_articles)
     logger.info(f"📊 English articles fetched: {len(english_articles)}")
     
-                       
-    logger.info(f"🔄 Removing duplicates from {len(all_articles)} total articles...")
-    unique_articles = _remove_duplicate_articles(all_articles)
-    
     logger.info(f"✅ Unlimited fetch completed: {len(unique_articles)} unique articles")
     logger.info(f"📊 GDELT articles: {len([a for a in unique_articles if a.get('fetch_source') == 'gdelt'])}")
                                       
@@ -1377,53 +1673,6 @@ def _filter_failed_domains(articles: List[Dict[str, Any]], tracker: DomainFailur
     return filtered_articles
 
 
-def _remove_duplicate_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """
-    Remove duplicate articles based on URL and normalized domain+title.
-    
-    Handles subdomain variations (e.g., cnn.com vs edition.cnn.com) by normalizing
-    domains and checking for same title from same base domain.
-    
-    NOTE: Database deduplication is now handled AFTER processing in pipeline.py
-    to ensure we don't lose articles before they're fully processed.
-    
-    Args:
-        articles: List of article dictionaries
-        
-    Returns:
-        List[Dict]: Deduplicated list of articles (in-memory only)
-    """
-    seen_urls: Set[str] = set()
-    seen_domain_title: Set[tuple] = set()
-    unique_articles = []
-    
-    for article in articles:
-        url = article.get('url', '')
-        title = article.get('title', '').strip().lower()
-        domain = article.get('domain', '')
-        
-        is_duplicate = False
-        
-        if url and url in seen_urls:
-            is_duplicate = True
-        elif domain and title:
-            normalized_domain = normalize_domain_for_dedup(domain)
-            domain_title_key = (normalized_domain, title)
-            if domain_title_key in seen_domain_title:
-                is_duplicate = True
-                logger.debug(f"Duplicate detected: {normalized_domain} - '{title[:50]}...'")
-            else:
-                seen_domain_title.add(domain_title_key)
-        
-        if not is_duplicate:
-            if url:
-                seen_urls.add(url)
-            unique_articles.append(article)
-            
-    logger.info(f"Removed {len(articles) - len(unique_articles)} in-memory duplicate articles")
-    return unique_articles
-
-
 
 
 
@@ -2,7 +2,11 @@
 Logging configuration for the news scraping service.
 """
 
+import os
 import sys
+import atexit
+import queue
+import threading
 import logging
 import logging.handlers
 from pathlib import Path
@@ -14,6 +18,77 @@ try:
 except ImportError:
     LOGURU_AVAILABLE = False
 
+_active_level = logging.INFO
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a large buffer.
+    
+    The stream is flushed every ``flush_records`` records, immediately for
+    ERROR and above, and by a background timer at most ``flush_interval``
+    seconds after a record is written, instead of after every record. The
+    file size is tracked in memory, in encoded bytes, so the rollover check
+    does not force a flush by seeking.
+    """
+    
+    def __init__(self, filename, *args, buffer_size: int = 64 * 1024,
+                 flush_records: int = 100, flush_interval: float = 5.0, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self._stream_size = 0
+        self._stream_encoding = 'utf-8'
+        self._pending_records = 0
+        super().__init__(filename, *args, **kwargs)
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_periodically,
+                                              name="log-file-flush", daemon=True)
+        self._flush_thread.start()
+    
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._stream_encoding = stream.encoding
+        self._stream_size = os.path.getsize(self.baseFilename)
+        return stream
+    
+    def _flush_periodically(self):
+        while not self._flush_stop.wait(self.flush_interval):
+            if self._pending_records:
+                self.flush()
+    
+    def flush(self):
+        with self.lock:
+            self._pending_records = 0
+            super().flush()
+    
+    def close(self):
+        self._flush_stop.set()
+        super().close()
+    
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            msg_size = len(msg.encode(self._stream_encoding, errors='replace'))
+            if self.maxBytes > 0 and self._stream_size > 0 and self._stream_size + msg_size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._stream_size += msg_size
+            self._pending_records += 1
+            
+            if record.levelno >= logging.ERROR or self._pending_records >= self.flush_records:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
 
 def setup_logger(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -26,6 +101,9 @@ def setup_logger(log_level: str = "INFO", log_file: Optional[str] = None) -> log
     Returns:
         Configured logger instance
     """
+    global _active_level
+    _active_level = getattr(logging, log_level.upper(), logging.INFO)
+    
     if LOGURU_AVAILABLE:
         return setup_loguru_logger(log_level, log_file)
     else:
@@ -59,14 +137,27 @@ def setup_loguru_logger(log_level: str = "INFO", log_file: Optional[str] = None)
             rotation="10 MB",
             retention="30 days",
             compression="zip",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}"
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
+            enqueue=True
         )
     
     return loguru_logger
 
 
 def setup_standard_logger(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
-    """Set up standard Python logger."""
+    """Set up standard Python logger.
+    
+    Handlers run on a background QueueListener thread, so callers only
+    enqueue records instead of blocking on console and file writes.
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+    
                    
     logger = logging.getLogger("news_scraper")
     logger.setLevel(getattr(logging, log_level.upper()))
@@ -84,29 +175,85 @@ def setup_standard_logger(log_level: str = "INFO", log_file: Optional[str] = Non
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, log_level.upper()))
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
                   
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(exist_ok=True)
         
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_file,
             maxBytes=10*1024*1024,        
             backupCount=5
         )
         file_handler.setLevel(getattr(logging, log_level.upper()))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     return logger
 
 
+def _stop_queue_listener():
+    """Flush and stop the standard-logging queue listener at interpreter exit."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
+
+
+def is_enabled_for(level: int) -> bool:
+    """
+    Check whether records at the given level are emitted by the configured logger.
+    
+    Works for both loguru and standard logging, unlike ``Logger.isEnabledFor``.
+    
+    Args:
+        level: Standard logging level, e.g. ``logging.DEBUG``
+        
+    Returns:
+        True if the level passes the configured threshold
+    """
+    return level >= _active_level
+
+
+class _BraceMessage:
+    """Log message that is only formatted with str.format when it is emitted."""
+    
+    def __init__(self, fmt: str, args: tuple, kwargs: dict):
+        self.fmt = fmt
+        self.args = args
+        self.kwargs = kwargs
+    
+    def __str__(self) -> str:
+        return str(self.fmt).format(*self.args, **self.kwargs)
+
+
+class _BraceStyleAdapter(logging.LoggerAdapter):
+    """Standard logging adapter accepting loguru-style ``{}`` placeholders."""
+    
+    def log(self, level, msg, *args, **kwargs):
+        if self.isEnabledFor(level):
+            log_kwargs = {key: kwargs.pop(key) for key in ('exc_info', 'stack_info', 'stacklevel', 'extra') if key in kwargs}
+            if args or kwargs:
+                msg = _BraceMessage(msg, args, kwargs)
+            log_kwargs['stacklevel'] = log_kwargs.get('stacklevel', 1) + 1
+            self.logger._log(level, msg, (), **log_kwargs)
+
+
 def get_logger(name: str = None):
     """
     Get a logger instance.
     
+    Messages may defer formatting with ``{}`` placeholders, e.g.
+    ``logger.debug("Loaded {} URLs", len(urls))``, for both backends.
+    
     Args:
         name: Logger name
         
@@ -118,7 +265,7 @@ def get_logger(name: str = None):
             return loguru_logger.bind(name=name)
         return loguru_logger
     else:
-        return logging.getLogger(name or "news_scraper")
+        return _BraceStyleAdapter(logging.getLogger(name or "news_scraper"), {})
 
 
                        
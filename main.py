@@ -21,10 +21,12 @@ except ImportError:
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-import pipeline
 from config import load_config
 from logger import setup_logger, get_logger
 
+                   
+logger = get_logger(__name__)
+
 
 def setup_logging():
     """Configure logging with rotating file and console output."""
@@ -41,29 +43,26 @@ def setup_logging():
 
 def run_single_batch():
     """Run single batch verification mode."""
-    logger = get_logger(__name__)
-    
     try:
         logger.info("Starting single batch verification mode")
+        import pipeline
         pipeline.run_batch()
         logger.info("Single batch verification completed successfully")
         
     except Exception as e:
-        logger.error(f"Single batch verification failed: {e}")
+        logger.error("Single batch verification failed: {}", e)
         sys.exit(1)
 
 
 
 def run_ai_test():
     """Run AI classification test mode."""
-    logger = get_logger(__name__)
-    
     try:
         logger.info("Starting AI classification test mode")
         logger.info("AI classification test completed successfully")
         
     except Exception as e:
-        logger.error(f"AI classification test failed: {e}")
+        logger.error("AI classification test failed: {}", e)
         sys.exit(1)
 
 
@@ -71,65 +70,58 @@ def run_ai_test():
 
 def run_danish_test():
     """Run Danish news test mode."""
-    logger = get_logger(__name__)
-    
     try:
         logger.info("Starting Danish news test mode")
         logger.info("Danish news test completed successfully")
         
     except Exception as e:
-        logger.error(f"Danish news test failed: {e}")
+        logger.error("Danish news test failed: {}", e)
         sys.exit(1)
 
 
 def run_hybrid_test():
     """Run hybrid news test mode."""
-    logger = get_logger(__name__)
-    
     try:
         logger.info("Starting hybrid news test mode")
         logger.info("Hybrid news test completed successfully")
         
     except Exception as e:
-        logger.error(f"Hybrid news test failed: {e}")
+        logger.error("Hybrid news test failed: {}", e)
         sys.exit(1)
 
 
 def run_database_test():
     """Run database functionality test mode."""
-    logger = get_logger(__name__)
-    
     try:
         logger.info("Starting database functionality test mode")
         logger.info("Database functionality test completed successfully")
         
     except Exception as e:
-        logger.error(f"Database functionality test failed: {e}")
+        logger.error("Database functionality test failed: {}", e)
         sys.exit(1)
 
 
 def run_continuous_mode():
     """Run continuous scheduling mode."""
-    logger = get_logger(__name__)
-    
     try:
         logger.info("Starting continuous pipeline mode")
         logger.info("Pipeline will run every 2 hours (configurable)")
         
                                                                             
-        import os
-        os.environ['MAX_ARTICLES'] = '0'                  
+        config = load_config()
+        config.max_articles = 0
         
                                            
+        import pipeline
         from scheduler import start_scheduler
         
                                                                          
-        start_scheduler(pipeline.run_batch)
+        start_scheduler(lambda: pipeline.run_batch(config))
         
     except KeyboardInterrupt:
         logger.info("Received shutdown signal, stopping gracefully")
     except Exception as e:
-        logger.error(f"Continuous mode failed: {e}")
+        logger.error("Continuous mode failed: {}", e)
         sys.exit(1)
     finally:
         logger.info("Pipeline service stopped")
@@ -207,8 +199,6 @@ def main():
     
                          
     setup_logging()
-    logger = get_logger(__name__)
-    
                              
     config = load_config()
     logger.info("="*60)
@@ -226,11 +216,11 @@ def main():
         mode = 'Single batch verification'
     else:
         mode = 'Continuous pipeline'
-    logger.info(f"Mode: {mode}")
-    logger.info(f"Storage directory: {config.storage_dir}")
-    logger.info(f"Log path: {config.log_path}")
-    logger.info(f"Fetch interval: {config.fetch_interval_minutes} minutes")
-    logger.info(f"Log level: {config.log_level}")
+    logger.info("Mode: {}", mode)
+    logger.info("Storage directory: {}", config.storage_dir)
+    logger.info("Log path: {}", config.log_path)
+    logger.info("Fetch interval: {} minutes", config.fetch_interval_minutes)
+    logger.info("Log level: {}", config.log_level)
     logger.info("="*60)
     
     try:
@@ -254,7 +244,7 @@ def main():
             run_continuous_mode()
             
     except Exception as e:
-        logger.error(f"Application failed: {e}")
+        logger.error("Application failed: {}", e)
         sys.exit(1)
 
 
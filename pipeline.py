@@ -6,25 +6,37 @@ except ImportError:
     pass                                                          
 
 import fetcher
+from fetcher import normalize_domain_for_dedup
 import processor
-from ai_classifier import classify_articles_ai_topics, get_ai_topic_summary
 from database import get_database, init_database
-from logger import get_logger
+from logger import get_logger, is_enabled_for
 from config import load_config
-from datetime import datetime
+import logging
+import time
 from pathlib import Path
 from typing import Set
 
 from summaries import (
+    append_danish_summary_entries,
     load_danish_summary_cache,
-    save_danish_summary_cache,
-    translate_summary_to_danish,
+    summary_cache_key,
+    translate_summaries_to_danish,
 )
 
                    
 logger = get_logger(__name__)
 
 
+_DANISH_DOMAINS = frozenset({
+    'journalisten.dk', 'dr.dk', 'tv2.dk', 'berlingske.dk', 'jyllands-posten.dk', 
+    'ekstrabladet.dk', 'bt.dk', 'information.dk', 'weekendavisen.dk', 
+    'kristeligt-dagblad.dk', 'kforum.dk', 'medietrends.dk', 'mediawatch.dk', 
+    'markedsforing.dk', 'bureaubiz.dk', 'ekkofilm.dk', 'digitalfoto.dk', 
+    'soundvenue.dk', 'ddc.dk', 'computerworld.dk', 'version2.dk', 'elektronista.dk',
+    'politiken.dk', 'arbejderen.dk', 'avisen.dk', 'nordjyske.dk', 'sn.dk', 'fyens.dk'
+})
+
+
 def _is_danish_article(article) -> bool:
     """
     Determine if an article is Danish based on domain and language.
@@ -35,31 +47,115 @@ def _is_danish_article(article) -> bool:
     Returns:
         bool: True if the article is Danish, False otherwise
     """
-    domain = article.get('domain', '').lower()
-    language = article.get('language', 'en').lower()
+    return (article.get('domain', '').lower() in _DANISH_DOMAINS
+            or article.get('language', 'en').lower() == 'da')
+
+
+def _remove_database_duplicates(articles, processed_urls, seen_domain_title, debug_enabled=False):
+    """
+    Drop articles that are already stored or repeat another article.
+    
+    An article is a duplicate if its URL is in processed_urls, or if its
+    normalized domain and lowercased title were already seen. New keys are
+    added to seen_domain_title.
     
-    danish_domains = [
-                                                  
-        'journalisten.dk', 'dr.dk', 'tv2.dk', 'berlingske.dk', 'jyllands-posten.dk', 
-        'ekstrabladet.dk', 'bt.dk', 'information.dk', 'weekendavisen.dk', 
-        'kristeligt-dagblad.dk', 'kforum.dk', 'medietrends.dk', 'mediawatch.dk', 
-        'markedsforing.dk', 'bureaubiz.dk', 'ekkofilm.dk', 'digitalfoto.dk', 
-        'soundvenue.dk', 'ddc.dk', 'computerworld.dk', 'version2.dk', 'elektronista.dk',
-        'politiken.dk', 'arbejderen.dk', 'avisen.dk', 'nordjyske.dk', 'sn.dk', 'fyens.dk'
+    Args:
+        articles: Processed article dictionaries
+        processed_urls: URLs already stored in the database
+        seen_domain_title: Set of (normalized domain, title) keys, updated in place
+        debug_enabled: Whether to log each removed article
+        
+    Returns:
+        Tuple of (kept articles, kept Danish count, removed Danish count, removed English count)
+    """
+    final_articles = []
+    keep_article = final_articles.append
+    add_key = seen_domain_title.add
+    is_danish_article = _is_danish_article
+    kept_danish_count = 0
+    removed_danish_count = 0
+    removed_english_count = 0
+    
+    urls = [article.get('url', '') for article in articles]
+    dedup_keys = [
+        (normalize_domain_for_dedup(article.get('domain', '')), article.get('title', '').strip().lower())
+        for article in articles
     ]
     
-    return any(danish_domain == domain for danish_domain in danish_domains) or language == 'da'
+    for article, url, domain_title_key in zip(articles, urls, dedup_keys):
+        normalized_domain, title = domain_title_key
+        is_danish = is_danish_article(article)
+        
+        is_duplicate = False
+        
+        if url and url in processed_urls:
+            is_duplicate = True
+        elif normalized_domain and title:
+            if domain_title_key in seen_domain_title:
+                is_duplicate = True
+                if debug_enabled:
+                    logger.debug("Duplicate detected by domain+title: {} - '{}...'", normalized_domain, title[:50])
+            else:
+                add_key(domain_title_key)
+        
+        if not is_duplicate:
+            keep_article(article)
+            if is_danish:
+                kept_danish_count += 1
+        elif is_danish:
+            removed_danish_count += 1
+            if debug_enabled:
+                logger.debug("Removing Danish duplicate: {}", url)
+        else:
+            removed_english_count += 1
+            if debug_enabled:
+                logger.debug("Removing English duplicate: {}", url)
+    
+    return final_articles, kept_danish_count, removed_danish_count, removed_english_count
 
 
-def run_batch():
-    """Orchestrate article fetching, processing, and database storage."""
+def _log_quota_shortfall(target_articles: int, article_count: int, danish_count: int) -> None:
+    """
+    Log how many Danish and English articles are missing from a quota batch.
+    
+    Only used when max_articles is non-zero; unlimited mode has no quota.
+    
+    Args:
+        target_articles: Configured max_articles, split evenly between languages
+        article_count: Number of validated articles before deduplication
+        danish_count: Number of those articles that are Danish
+    """
+    if article_count >= target_articles:
+        return
+    
+    target_danish = target_articles // 2
+    target_english = target_articles - target_danish
+    
+    missing_danish = max(0, target_danish - danish_count)
+    missing_english = max(0, target_english - (article_count - danish_count))
+    total_missing = missing_danish + missing_english
+    
+    logger.info("Need {} more valid articles ({} Danish, {} English)", total_missing, missing_danish, missing_english)
+
+
+def run_batch(config=None):
+    """
+    Orchestrate article fetching, processing, and database storage.
+    
+    Args:
+        config: Configuration to use; defaults to the shared load_config() instance
+        
+    Returns:
+        Dict: Statistics for this batch run
+    """
     db = init_database()
-    config = load_config()
+    if config is None:
+        config = load_config()
 
     storage_dir = config.storage_dir if hasattr(config, "storage_dir") else Path("data")
-    summary_cache_path = Path(storage_dir) / "danish_summaries.json"
+    summary_cache_path = Path(storage_dir) / "danish_summaries.jsonl"
     summary_cache = load_danish_summary_cache(summary_cache_path)
-    summary_cache_updated = False
+    new_summary_entries = {}
 
                              
     run_id = db.start_pipeline_run()
@@ -79,7 +175,8 @@ def run_batch():
         'domain_failure_count': 0
     }
 
-    start_time = datetime.now()
+    start_time = time.perf_counter()
+    debug_enabled = is_enabled_for(logging.DEBUG)
 
     try:
                                                               
@@ -106,13 +203,13 @@ def run_batch():
                 return stats
                 
             stats['fetched_articles'] = len(articles)
-            logger.info(f"Successfully obtained {len(articles)} real articles from GDELT")
+            logger.info("Successfully obtained {} real articles from GDELT", len(articles))
             
                                                              
             if failure_report['total_failures'] > 0:
-                logger.warning(f"Domain failure report: {failure_report['total_failures']} failed domains")
+                logger.warning("Domain failure report: {} failed domains", failure_report['total_failures'])
                 for domain, count in failure_report['failure_counts'].items():
-                    logger.warning(f"  - {domain}: {count} failures")
+                    logger.warning("  - {}: {} failures", domain, count)
                 stats['failed_domains'] = failure_report['failed_domains']
                 stats['domain_failure_count'] = failure_report['total_failures']
             else:
@@ -120,7 +217,7 @@ def run_batch():
             
         except (fetcher.DownloadError, fetcher.ExtractionError, fetcher.FetcherError) as e:
                                                              
-            logger.warning(f"GDELT data fetch failed: {e} - skipping this batch")
+            logger.warning("GDELT data fetch failed: {} - skipping this batch", e)
             stats['failed_fetching'] += 1
             return stats
 
@@ -129,67 +226,32 @@ def run_batch():
         processed_articles = []
         rejected_articles = []
         
-        for article in articles:
-            try:
-                if processor.validate_article(article):
-                    processed_article = processor.process_article(article)
-                    processed_articles.append(processed_article)
-                else:
-                    logger.debug(f"Article failed validation: {article.get('url', 'unknown')}")
-                                                                    
-                    article['rejection_reason'] = 'validation_failed'
-                    rejected_articles.append(article)
-            except Exception as e:
-                logger.warning(f"Error processing article: {e}")
+        valid_articles, invalid_articles = processor.validate_articles_batch(articles)
+        for article in invalid_articles:
+            if debug_enabled:
+                logger.debug("Article failed validation: {}", article.get('url', 'unknown'))
+                                                            
+            rejected_articles.append(processor.RejectedArticle(article, 'validation_failed'))
+        
+        for article, (processed_article, error) in zip(valid_articles, processor.process_articles_batch(valid_articles)):
+            if processed_article is not None:
+                processed_articles.append(processed_article)
+            else:
+                logger.warning("Error processing article: {}", error)
                 stats['failed_processing'] += 1
-                                                                
-                article['rejection_reason'] = f'processing_error: {str(e)}'
-                rejected_articles.append(article)
+                                                            
+                rejected_articles.append(processor.RejectedArticle(article, f'processing_error: {error}'))
 
         initial_validated = len(processed_articles)
         stats['validated_articles'] = initial_validated
-        logger.info(f"Successfully processed {initial_validated} articles from initial fetch")
-
-                                                                     
-        target_articles = config.max_articles
-        
-                                                                
-        if target_articles == 0:
-            logger.info("🔄 Unlimited mode: skipping quota logic (all articles already fetched)")
-                                           
-            pass
-        else:
-                                                              
-            target_danish = target_articles // 2
-            target_english = target_articles - target_danish
-            
-            if len(processed_articles) < target_articles:
-                                                                                               
-                current_danish = 0
-                current_english = 0
-                
-                for article in processed_articles:
-                    if _is_danish_article(article):
-                        current_danish += 1
-                    else:
-                        current_english += 1
-                
-                missing_danish = max(0, target_danish - current_danish)
-                missing_english = max(0, target_english - current_english)
-                total_missing = missing_danish + missing_english
-                
-                logger.info(f"Need {total_missing} more valid articles ({missing_danish} Danish, {missing_english} English)")
-            
-                                                                           
+        logger.info("Successfully processed {} articles from initial fetch", initial_validated)
 
                                                                
         logger.info("Removing database duplicates from processed articles")
         try:
-            processed_urls = db.get_processed_urls()
-            logger.debug(f"Found {len(processed_urls)} already processed URLs in database")
+            processed_urls = db.get_existing_urls(article.get('url', '') for article in processed_articles)
+            logger.debug("Found {} of this batch's URLs already in database", len(processed_urls))
             
-            from fetcher import normalize_domain_for_dedup
-
             seen_domain_title: Set[tuple] = set()
 
 
@@ -199,114 +261,100 @@ def run_batch():
                         normalize_domain_for_dedup(existing_domain or ''),
                         (existing_title or '').strip().lower()
                     ))
-                logger.debug(f"Seeded {len(seen_domain_title)} domain+title dedup keys from database")
+                logger.debug("Seeded {} domain+title dedup keys from database", len(seen_domain_title))
             except Exception as seed_error:
-                logger.warning(f"Could not seed dedup keys from database: {seed_error}")
-            final_articles = []
-            duplicates_removed = 0
-            removed_danish_count = 0
-            removed_english_count = 0
+                logger.warning("Could not seed dedup keys from database: {}", seed_error)
+            final_articles, kept_danish_count, removed_danish_count, removed_english_count = _remove_database_duplicates(
+                processed_articles, processed_urls, seen_domain_title, debug_enabled
+            )
+            duplicates_removed = removed_danish_count + removed_english_count
             
-                                                        
-            for article in processed_articles:
-                url = article.get('url', '')
-                title = article.get('title', '').strip().lower()
-                domain = article.get('domain', '')
-                
-                is_duplicate = False
-                
-                if url and url in processed_urls:
-                    is_duplicate = True
-                elif domain and title:
-                    normalized_domain = normalize_domain_for_dedup(domain)
-                    domain_title_key = (normalized_domain, title)
-                    if domain_title_key in seen_domain_title:
-                        is_duplicate = True
-                        logger.debug(f"Duplicate detected by domain+title: {normalized_domain} - '{title[:50]}...'")
-                    else:
-                        seen_domain_title.add(domain_title_key)
-                
-                if not is_duplicate:
-                    final_articles.append(article)
-                else:
-                    duplicates_removed += 1
-                                                        
-                    if _is_danish_article(article):
-                        removed_danish_count += 1
-                        logger.debug(f"Removing Danish duplicate: {url}")
-                    else:
-                        removed_english_count += 1
-                        logger.debug(f"Removing English duplicate: {url}")
+            logger.info("Removed {} database duplicates ({} Danish, {} English), keeping {} articles", duplicates_removed, removed_danish_count, removed_english_count, len(final_articles))
+            
+                                                                     
+            if config.max_articles == 0:
+                logger.info("🔄 Unlimited mode: skipping quota logic (all articles already fetched)")
+            else:
+                _log_quota_shortfall(
+                    config.max_articles,
+                    len(processed_articles),
+                    kept_danish_count + removed_danish_count
+                )
             
-            logger.info(f"Removed {duplicates_removed} database duplicates ({removed_danish_count} Danish, {removed_english_count} English), keeping {len(final_articles)} articles")
             processed_articles = final_articles
             
                                                                             
                                                                                                                 
             total_removed = removed_danish_count + removed_english_count
             if total_removed > 0:
-                logger.info(f"Removed {total_removed} duplicates but continuing with unlimited mode - no replacement needed")
+                logger.info("Removed {} duplicates but continuing with unlimited mode - no replacement needed", total_removed)
                                                                                    
                                                                                     
             
         except Exception as e:
-            logger.warning(f"Failed to remove database duplicates: {e}")
+            logger.warning("Failed to remove database duplicates: {}", e)
                                                                          
 
                                          
         logger.info("Starting AI topic classification")
         if processed_articles:
             try:
+                from ai_classifier import classify_articles_ai_topics
+                
                 ai_results = classify_articles_ai_topics(processed_articles)
-                stats['ai_topic_count'] = len(
-                    [
-                        a
-                        for a in ai_results
-                        if a.get("ai_topic_analysis", {}).get("is_ai_topic", False)
-                    ]
+                stats['ai_topic_count'] = sum(
+                    1
+                    for a in ai_results
+                    if (a.get("ai_topic_analysis") or {}).get("is_ai_topic", False)
                 )
                 logger.info(
-                    f"AI topic classification completed: {stats['ai_topic_count']} AI-related articles detected"
+                    "AI topic classification completed: {} AI-related articles detected", stats['ai_topic_count']
                 )
             except Exception as e:
-                logger.warning(f"AI topic classification failed: {e}")
+                logger.warning("AI topic classification failed: {}", e)
                 stats["ai_topic_count"] = 0
         else:
             stats["ai_topic_count"] = 0
 
+        ai_summaries = []
         for article in processed_articles:
-            analysis = article.get("ai_topic_analysis", {}) or {}
+            analysis = article.get("ai_topic_analysis")
+            if not analysis:
+                continue
 
-            if analysis:
-                article["ai_topic"] = analysis.get("topic")
-                article["ai_confidence"] = analysis.get("confidence")
-                article["ai_keywords"] = analysis.get("keywords", [])
+            fields = {
+                "ai_topic": analysis.get("topic"),
+                "ai_confidence": analysis.get("confidence"),
+                "ai_keywords": analysis.get("keywords", []),
+            }
 
-            summary_en = analysis.get("explanation") if analysis else None
+            summary_en = analysis.get("explanation")
             if summary_en:
                 if summary_en.startswith("OpenAI: "):
                     summary_en = summary_en[8:]
-                article["summary_en"] = summary_en
+                fields["summary_en"] = summary_en
 
             if analysis.get("is_ai_topic"):
-                url = article.get("url", "")
-                danish_summary, cache_changed = translate_summary_to_danish(
-                    summary_en or "",
-                    url,
-                    summary_cache,
-                )
-                article["summary_da"] = danish_summary or summary_en or ""
-                if cache_changed:
-                    summary_cache_updated = True
+                ai_summaries.append((article, summary_en or ""))
             elif summary_en:
-                article["summary_da"] = summary_en
+                fields["summary_da"] = summary_en
+
+            article.update(fields)
+
+        new_summary_entries.update(translate_summaries_to_danish(
+            [(article.get("url", ""), summary_en) for article, summary_en in ai_summaries],
+            summary_cache,
+        ))
+        for article, summary_en in ai_summaries:
+            cache_key = summary_cache_key(article.get("url", ""), summary_en)
+            article["summary_da"] = summary_cache.get(cache_key, summary_en) if summary_en else ""
 
                                                       
         if processed_articles or rejected_articles:
             logger.info("Storing processed articles")
             try:
                 storage_files = processor.store_articles(processed_articles, rejected_articles)
-                articles_file, articles_metadata_file, rejected_file, rejected_metadata_file = storage_files
+                articles_file, manifest_file, rejected_file = storage_files
                 
                 stats['stored_articles'] = len(processed_articles)
                 stats['rejected_articles'] = len(rejected_articles)
@@ -319,46 +367,45 @@ def run_batch():
                 if rejected_file:
                     db.add_rejected_articles(rejected_articles, str(rejected_file))
                 
-                logger.info(f"Successfully stored {len(processed_articles)} valid articles and {len(rejected_articles)} rejected articles")
-                logger.info(f"Files created: {articles_file}, {articles_metadata_file}, {rejected_file}, {rejected_metadata_file}")
+                logger.info("Successfully stored {} valid articles and {} rejected articles", len(processed_articles), len(rejected_articles))
+                logger.info("Files created: {}, {}, {}", articles_file, rejected_file, manifest_file)
 
-                if summary_cache_updated:
-                    save_danish_summary_cache(summary_cache_path, summary_cache)
+                append_danish_summary_entries(summary_cache_path, new_summary_entries, summary_cache)
             except Exception as e:
-                logger.error(f"Failed to store articles: {e}")
+                logger.error("Failed to store articles: {}", e)
                 stats['failed_storage'] = len(processed_articles) + len(rejected_articles)
         else:
             logger.warning("No articles to store (valid or rejected)")
 
     except fetcher.FetcherError as e:
-        logger.error(f"Fetcher error: {e}")
+        logger.error("Fetcher error: {}", e)
         stats['failed_fetching'] += 1
 
     except processor.ProcessorError as e:
-        logger.error(f"Processor error: {e}")
+        logger.error("Processor error: {}", e)
         stats['failed_processing'] += 1
 
     except processor.ValidationError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: {}", e)
         stats['failed_validation'] += 1
 
     except processor.StorageError as e:
-        logger.error(f"Storage error: {e}")
+        logger.error("Storage error: {}", e)
         stats['failed_storage'] += 1
 
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: {}", e)
         stats['failed_fetching'] += 1
 
                                
-    processing_time = (datetime.now() - start_time).total_seconds()
+    processing_time = time.perf_counter() - start_time
     stats['processing_time'] = processing_time
     
                                     
     db.complete_pipeline_run(run_id, stats)
     
-    logger.info(f"Batch run completed in {processing_time:.2f} seconds")
-    logger.info(f"Batch run summary: {stats}")
+    logger.info("Batch run completed in {:.2f} seconds", processing_time)
+    logger.info("Batch run summary: {}", stats)
     
     return stats
 
@@ -1,9 +1,12 @@
 """Article processing module for news scraping service."""
 
 import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+from operator import methodcaller
+from typing import List, Dict, Any, Optional, NamedTuple, Tuple, Callable, Union
 from pathlib import Path
 from html import unescape
 import unicodedata
@@ -12,23 +15,78 @@ from logger import get_logger
 from config import load_config
 from utils import generate_content_hash, normalize_text
 
+                                      
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
                    
 logger = get_logger(__name__)
 
+_REQUIRED_FIELDS = ('url', 'title', 'text', 'date_publish')
+
+                                                                  
+_PLACEHOLDER_TEXT_TEMPLATE = (
+    "Article from %s. Full text extraction failed. This is a metadata-only article with title: %s. "
+    "The complete article content can be accessed at the provided URL."
+)
+
+                                                                   
+_writer_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="article-writer")
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle datetime objects."""
     
+                                                             
+    _dispatch: Dict[type, Callable[[Any], str]] = {}
+    
     def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif hasattr(obj, 'isoformat'):                                      
-            return obj.isoformat()
-        elif hasattr(obj, 'strftime'):                       
-            return obj.strftime('%Y-%m-%d')
-        elif hasattr(obj, 'total_seconds'):                            
-            return str(obj)
-        return super().default(obj)
+        obj_type = type(obj)
+        serializer = self._dispatch.get(obj_type)
+        if serializer is None:
+            if hasattr(obj_type, 'isoformat'):                                      
+                serializer = methodcaller('isoformat')
+            elif hasattr(obj_type, 'strftime'):                       
+                serializer = methodcaller('strftime', '%Y-%m-%d')
+            elif hasattr(obj_type, 'total_seconds'):                            
+                serializer = str
+            else:
+                return super().default(obj)
+            self._dispatch[obj_type] = serializer
+        return serializer(obj)
+
+
+def _orjson_default(obj):
+    """Serialize types orjson does not handle natively, mirroring DateTimeEncoder."""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    if hasattr(obj, 'total_seconds'):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_json(path: Union[str, Path], data: Any) -> None:
+    """
+    Write data as indented UTF-8 JSON, using orjson when it is installed.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data (datetimes are written as ISO strings)
+    """
+    if orjson is not None:
+        with open(path, 'wb', buffering=1 << 20) as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=_orjson_default))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, cls=DateTimeEncoder)
+
+
+class RejectedArticle(NamedTuple):
+    """Article that failed validation or processing, with the reason why."""
+    article: Dict[str, Any]
+    reason: str
 
 
 class ProcessorError(Exception):
@@ -46,6 +104,11 @@ class StorageError(ProcessorError):
     pass
 
 
+def _normalize_unicode(value: str) -> str:
+    """NFKC-normalize a string and drop anything UTF-8 cannot encode, such as lone surrogates."""
+    return unicodedata.normalize('NFKC', value).encode('utf-8', errors='ignore').decode('utf-8')
+
+
 def process_article(article: Dict[str, Any]) -> Dict[str, Any]:
     """
     Process article data by normalizing fields and enforcing encoding.
@@ -63,24 +126,11 @@ def process_article(article: Dict[str, Any]) -> Dict[str, Any]:
         logger.debug(f"Processing article: {article.get('title', 'Unknown')}")
         
                                                    
-        processed = {}
-        
-                                                                        
-        for key, value in article.items():
-            if value is not None:                    
-                processed[key] = value
-        
-                                                      
-        for key, value in processed.items():
-            if isinstance(value, str):
-                try:
-                                                  
-                    processed[key] = unicodedata.normalize('NFKC', value)
-                                                  
-                    processed[key] = value.encode('utf-8', errors='ignore').decode('utf-8')
-                except (UnicodeError, AttributeError) as e:
-                    logger.warning(f"Encoding issue with field '{key}': {e}")
-                    processed[key] = str(value)                                 
+        processed = {
+            key: _normalize_unicode(value) if isinstance(value, str) and not value.isascii() else value
+            for key, value in article.items()
+            if value is not None
+        }
         
                                             
         if 'text' in processed and processed['text']:
@@ -97,89 +147,173 @@ def process_article(article: Dict[str, Any]) -> Dict[str, Any]:
         raise ProcessorError(f"Failed to process article: {e}")
 
 
-def validate_article(article: Dict[str, Any]) -> bool:
+def _process_article_safely(article: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Process a single article, returning the error instead of raising.
+    
+    Args:
+        article: Validated article data dictionary
+        
+    Returns:
+        tuple: (processed article or None, error message or None)
+    """
+    try:
+        return process_article(article), None
+    except Exception as e:
+        return None, str(e)
+
+
+def process_articles_batch(articles: List[Dict[str, Any]]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Process a batch of validated articles.
+    
+    Args:
+        articles: Validated article data dictionaries
+        
+    Returns:
+        List: One (processed article or None, error message or None) tuple
+        per input article, in input order
+    """
+    return [_process_article_safely(article) for article in articles]
+
+
+def make_placeholder_text(article: Dict[str, Any]) -> str:
+    """
+    Build the stand-in text for a metadata-only article whose text could not be extracted.
+    
+    Args:
+        article: Article data dictionary
+        
+    Returns:
+        str: Placeholder text naming the article's domain and title
+    """
+    return _PLACEHOLDER_TEXT_TEMPLATE % (article.get('domain', 'unknown domain'), article.get('title', 'No title'))
+
+
+def validate_article(article: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
     Validate article data for required fields, content length, and format.
     
+    The article is not modified. When its text is empty, validation runs
+    against placeholder text instead, and the placeholder is returned so
+    the caller can apply it to a valid article.
+    
     Args:
         article: Article data dictionary
         
     Returns:
-        bool: True if valid, False otherwise
+        tuple: (True if valid, placeholder text to use as the article's text or None)
         
     Raises:
         ValidationError: If validation encounters an error
     """
     try:
-        config = load_config()
+        min_article_length = load_config().min_article_length
         
                                
-        required_keys = {'url', 'title', 'text', 'date_publish'}
-        missing_keys = required_keys - set(article.keys())
+        missing_keys = set(_REQUIRED_FIELDS) - article.keys()
         
         if missing_keys:
             logger.warning(f"Article missing required fields: {missing_keys}")
-            return False
+            return False, None
         
                                                           
-        for key in required_keys:
-            if key == 'text' and not article[key]:
-                                                          
-                article['text'] = f"Article from {article.get('domain', 'unknown domain')}. Full text extraction failed. This is a metadata-only article with title: {article.get('title', 'No title')}. The complete article content can be accessed at the provided URL."
-                logger.debug(f"Added placeholder text for article with failed extraction: {article.get('url', 'unknown')}")
-            elif not article[key] or (isinstance(article[key], str) and not article[key].strip()):
+        for key in ('url', 'title', 'date_publish'):
+            value = article[key]
+            if not value or (isinstance(value, str) and not value.strip()):
                 logger.warning(f"Article has empty required field: {key}")
-                return False
-        
-                                               
-        if article['text'].startswith("Article from") and len(article['text']) < config.min_article_length:
-            logger.warning(f"Metadata-only article too short even with placeholder: {len(article['text'])} chars")
-            return False
-        text_length = len(article['text']) if article['text'] else 0
-        if text_length < config.min_article_length:
-            logger.warning(f"Article too short: {text_length} chars (min: {config.min_article_length})")
-            return False
-        
-                                                                                  
+                return False, None
         
+        text = article['text']
+        placeholder = None
+        if not text:
+                                                      
+            placeholder = text = make_placeholder_text(article)
+            if len(text) < min_article_length:
+                logger.warning(f"Metadata-only article too short even with placeholder: {len(text)} chars")
+                return False, None
         
+        if len(text) < min_article_length:
+            logger.warning(f"Article too short: {len(text)} chars (min: {min_article_length})")
+            return False, None
         
                                                                     
         language = article.get('language')
         if language:
             logger.debug(f"Article language: {language}")
-                                                       
         
                              
         url = article.get('url', '')
         if not url.startswith(('http://', 'https://')):
             logger.warning(f"Invalid URL format: {url}")
-            return False
+            return False, None
         
+        if placeholder is not None:
+            logger.debug(f"Using placeholder text for article with failed extraction: {article.get('url', 'unknown')}")
         logger.debug(f"Article validation successful: {article.get('title', 'Unknown')}")
-        return True
+        return True, placeholder
         
     except Exception as e:
         logger.error(f"Error validating article: {e}")
         raise ValidationError(f"Failed to validate article: {e}")
 
 
-def store_articles(articles: List[Dict[str, Any]], rejected_articles: List[Dict[str, Any]] = None) -> tuple[Optional[Path], Optional[Path], Optional[Path], Optional[Path]]:
+def validate_articles_batch(articles: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Validate a batch of articles, splitting them into valid and invalid lists.
+    
+    Applies the same rules as validate_article. Valid articles without text
+    get the metadata-only placeholder text; invalid articles are left
+    untouched.
+    
+    Args:
+        articles: Article data dictionaries
+        
+    Returns:
+        tuple: (valid articles, invalid articles), each in input order
+    """
+    valid, invalid = [], []
+    for article in articles:
+        try:
+            is_valid, placeholder = validate_article(article)
+        except ValidationError:
+            is_valid, placeholder = False, None
+        if is_valid:
+            if placeholder is not None:
+                article['text'] = placeholder
+            valid.append(article)
+        else:
+            invalid.append(article)
+    if invalid:
+        logger.info(f"Batch validation rejected {len(invalid)} of {len(articles)} articles")
+    return valid, invalid
+
+
+def _remove_partial_file(filename: str) -> None:
+    """Delete a file left behind by a failed write, if it exists."""
+    try:
+        if os.path.exists(filename):
+            os.unlink(filename)
+            logger.info(f"Cleaned up partial file {filename}")
+    except Exception as cleanup_error:
+        logger.warning(f"Failed to cleanup partial file: {cleanup_error}")
+
+
+def store_articles(articles: List[Dict[str, Any]], rejected_articles: List[RejectedArticle] = None) -> tuple[Optional[Path], Optional[Path], Optional[Path]]:
     """
-    Store articles as newline-delimited JSON in timestamped files.
+    Store articles as formatted JSON in timestamped files.
     
-    Creates 4 files:
+    Creates up to 3 files:
     1. articles_{timestamp}.json - Valid articles that passed all validation (formatted JSON)
-    2. metadata_{timestamp}.json - Metadata for valid articles
-    3. rejected_articles_{timestamp}.json - Articles that failed validation/processing (formatted JSON)
-    4. rejected_metadata_{timestamp}.json - Metadata for rejected articles
+    2. rejected_articles_{timestamp}.json - Articles that failed validation/processing (formatted JSON)
+    3. manifest_{timestamp}.json - Metadata for both batches, keyed by file type
     
     Args:
         articles: List of article dictionaries to store (valid articles)
-        rejected_articles: List of rejected article dictionaries (optional)
+        rejected_articles: List of RejectedArticle entries (optional)
         
     Returns:
-        tuple: (articles_file, articles_metadata_file, rejected_file, rejected_metadata_file)
+        tuple: (articles_file, manifest_file, rejected_file)
         
     Raises:
         StorageError: If storage fails critically
@@ -199,125 +333,94 @@ def store_articles(articles: List[Dict[str, Any]], rejected_articles: List[Dict[
         raise StorageError(f"Cannot create storage directory: {e}")
     
                                     
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]                        
-    articles_filename = storage_dir / f"articles_{timestamp}.json"
-    articles_metadata_filename = storage_dir / f"metadata_{timestamp}.json"
+    now = datetime.now()
+    timestamp = now.strftime('%Y%m%d_%H%M%S_%f')[:-3]                        
+    storage_prefix = str(storage_dir) + os.sep
+    articles_filename = f"{storage_prefix}articles_{timestamp}.json"
+    manifest_filename = f"{storage_prefix}manifest_{timestamp}.json"
     
                                                   
     if rejected_articles is None:
         rejected_articles = []
     
     rejected_filename = None
-    rejected_metadata_filename = None
-    
     if rejected_articles:
-        rejected_filename = storage_dir / f"rejected_articles_{timestamp}.json"
-        rejected_metadata_filename = storage_dir / f"rejected_metadata_{timestamp}.json"
-    
-                      
-    stored_count = 0
-    failed_count = 0
-    failed_articles = []
+        rejected_filename = f"{storage_prefix}rejected_articles_{timestamp}.json"
     
     logger.info(f"Storing {len(articles)} valid articles to {articles_filename}")
     if rejected_articles:
         logger.info(f"Storing {len(rejected_articles)} rejected articles to {rejected_filename}")
     
+                                                                      
+    articles_future = _writer_pool.submit(_write_json, articles_filename, articles)
+    rejected_future = None
+    if rejected_articles:
+        rejected_future = _writer_pool.submit(
+            _write_json,
+            rejected_filename,
+            [{**rejected.article, 'rejection_reason': rejected.reason} for rejected in rejected_articles]
+        )
+    
                           
     try:
-        with open(articles_filename, 'w', encoding='utf-8') as f:
-                                                          
-            json.dump(articles, f, indent=2, ensure_ascii=False, cls=DateTimeEncoder)
-            stored_count = len(articles)
-        
-                                        
-        logger.info(f"Successfully stored {stored_count} valid articles to {articles_filename}")
-        
-        if failed_count > 0:
-            logger.warning(f"Failed to store {failed_count} valid articles")
-                                            
-            for failure in failed_articles:
-                logger.warning(f"Failed valid article {failure['index']}: "
-                             f"{failure['title']} - {failure['error']}")
-        
-                                                    
-        valid_metadata = {
-            'timestamp': datetime.now().isoformat(),
-            'file_type': 'valid_articles',
-            'total_articles': len(articles),
-            'stored_count': stored_count,
-            'failed_count': failed_count,
-            'filename': str(articles_filename),
-            'failed_articles': failed_articles
+        articles_future.result()
+        logger.info(f"Successfully stored {len(articles)} valid articles to {articles_filename}")
+        
+        manifest = {
+            'timestamp': now.isoformat(),
+            'valid_articles': {
+                'total_articles': len(articles),
+                'stored_count': len(articles),
+                'failed_count': 0,
+                'filename': articles_filename,
+                'failed_articles': []
+            }
         }
         
-                                            
-        try:
-            with open(articles_metadata_filename, 'w', encoding='utf-8') as f:
-                json.dump(valid_metadata, f, indent=2, ensure_ascii=False, cls=DateTimeEncoder)
-            logger.debug(f"Stored valid articles metadata to {articles_metadata_filename}")
-        except Exception as e:
-            logger.warning(f"Failed to store valid articles metadata: {e}")
-        
                                         
-        rejected_stored_count = 0
-        rejected_failed_count = 0
-        rejected_failed_articles = []
-        
-        if rejected_articles and rejected_filename:
+        if rejected_future is not None:
             try:
-                with open(rejected_filename, 'w', encoding='utf-8') as f:
-                                                                           
-                    json.dump(rejected_articles, f, indent=2, ensure_ascii=False, cls=DateTimeEncoder)
-                    rejected_stored_count = len(rejected_articles)
-                
-                logger.info(f"Successfully stored {rejected_stored_count} rejected articles to {rejected_filename}")
-                
-                if rejected_failed_count > 0:
-                    logger.warning(f"Failed to store {rejected_failed_count} rejected articles")
-                    for failure in rejected_failed_articles:
-                        logger.warning(f"Failed rejected article {failure['index']}: "
-                                     f"{failure['title']} - {failure['error']}")
-                
-                                                               
-                rejected_metadata = {
-                    'timestamp': datetime.now().isoformat(),
-                    'file_type': 'rejected_articles',
+                rejected_future.result()
+                logger.info(f"Successfully stored {len(rejected_articles)} rejected articles to {rejected_filename}")
+                manifest['rejected_articles'] = {
                     'total_articles': len(rejected_articles),
-                    'stored_count': rejected_stored_count,
-                    'failed_count': rejected_failed_count,
-                    'filename': str(rejected_filename),
-                    'failed_articles': rejected_failed_articles
+                    'stored_count': len(rejected_articles),
+                    'failed_count': 0,
+                    'filename': rejected_filename,
+                    'failed_articles': []
                 }
-                
-                                                       
-                try:
-                    with open(rejected_metadata_filename, 'w', encoding='utf-8') as f:
-                        json.dump(rejected_metadata, f, indent=2, ensure_ascii=False, cls=DateTimeEncoder)
-                    logger.debug(f"Stored rejected articles metadata to {rejected_metadata_filename}")
-                except Exception as e:
-                    logger.warning(f"Failed to store rejected articles metadata: {e}")
-                    
-            except IOError as e:
-                logger.error(f"IO error storing rejected articles to {rejected_filename}: {e}")
+            except (IOError, TypeError, ValueError) as e:
+                logger.error(f"Error storing rejected articles to {rejected_filename}: {e}")
+                _remove_partial_file(rejected_filename)
                 rejected_filename = None
-                rejected_metadata_filename = None
         
-        return articles_filename, articles_metadata_filename, rejected_filename, rejected_metadata_filename
-        
-    except IOError as e:
-        logger.error(f"IO error storing valid articles to {articles_filename}: {e}")
-                                      
+                                                 
         try:
-            if articles_filename.exists():
-                articles_filename.unlink()
-                logger.info(f"Cleaned up partial file {articles_filename}")
-        except Exception as cleanup_error:
-            logger.warning(f"Failed to cleanup partial file: {cleanup_error}")
+            _write_json(manifest_filename, manifest)
+            logger.debug(f"Stored batch manifest to {manifest_filename}")
+        except Exception as e:
+            logger.warning(f"Failed to store batch manifest: {e}")
+            manifest_filename = None
+        
+        return (
+            Path(articles_filename),
+            Path(manifest_filename) if manifest_filename else None,
+            Path(rejected_filename) if rejected_filename else None
+        )
+        
+    except (IOError, TypeError, ValueError) as e:
+        logger.error(f"Error storing valid articles to {articles_filename}: {e}")
+                                                                          
+        _remove_partial_file(articles_filename)
+        if rejected_future is not None:
+            try:
+                rejected_future.result()
+            except Exception:
+                pass
+            _remove_partial_file(rejected_filename)
         
         raise StorageError(f"Failed to store valid articles: {e}")
     
     except Exception as e:
         logger.error(f"Unexpected error storing valid articles: {e}")
         raise StorageError(f"Unexpected storage error: {e}")
-
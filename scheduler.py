@@ -1,7 +1,6 @@
 """Task scheduling functionality for automated news scraping."""
 
 import schedule
-import time
 import threading
 import signal
 from datetime import datetime
@@ -17,7 +16,7 @@ logger = get_logger(__name__)
 FETCH_INTERVAL = load_config().fetch_interval_minutes
 
                                    
-_shutdown_requested = False
+_shutdown_event = threading.Event()
 
 
 def run_batch():
@@ -28,28 +27,18 @@ def run_batch():
 
 def _signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    global _shutdown_requested
     logger.info(f"Received signal {signum}, initiating graceful shutdown")
-    _shutdown_requested = True
+    _shutdown_event.set()
 
 
 def start_scheduler(job_fn: Callable = None):
     """Start the scheduler that runs job_fn at configured intervals."""
-    global _shutdown_requested
-    
     config = load_config()
     fetch_interval = config.fetch_interval_minutes
     
     if job_fn is None:
         job_fn = run_batch
     
-    def unlimited_job_wrapper():
-        """Wrapper that ensures MAX_ARTICLES=0 for each job execution."""
-        import os
-        os.environ['MAX_ARTICLES'] = '0'
-        logger.info("Ensuring unlimited mode for scheduled job execution")
-        return job_fn()
-    
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
     
@@ -63,25 +52,31 @@ def start_scheduler(job_fn: Callable = None):
     def register_job():
         """Register the job with the scheduler."""
         schedule.clear()
-        schedule.every(fetch_interval).minutes.do(unlimited_job_wrapper)
+        schedule.every(fetch_interval).minutes.do(job_fn)
         logger.info(f"Job registered to run every {fetch_interval} minutes")
     
     register_job()
     
     try:
         logger.info("Running initial job execution")
-        unlimited_job_wrapper()
+        job_fn()
     except Exception as e:
         logger.error(f"Error in initial job execution: {e}")
     
-    while not _shutdown_requested:
+    while not _shutdown_event.is_set():
         try:
+            next_run = schedule.idle_seconds()
+            if next_run is None:
+                logger.warning("No scheduled jobs found, re-registering job")
+                register_job()
+                continue
+            if next_run > 0 and _shutdown_event.wait(min(next_run, 60)):
+                break
             schedule.run_pending()
-            time.sleep(1)
             
         except KeyboardInterrupt:
             logger.info("KeyboardInterrupt received, initiating graceful shutdown")
-            _shutdown_requested = True
+            _shutdown_event.set()
             break
             
         except Exception as e:
@@ -94,7 +89,7 @@ def start_scheduler(job_fn: Callable = None):
             except Exception as reg_error:
                 logger.error(f"Failed to re-register job: {reg_error}")
             
-            time.sleep(60)
+            _shutdown_event.wait(60)
     
     logger.info("Scheduler shutting down gracefully")
     schedule.clear()
@@ -17,6 +17,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 from collections import Counter, defaultdict
+from operator import itemgetter
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -64,17 +65,17 @@ def normalize_ai_topic(topic: Any) -> str:
 def get_ai_articles_by_topic(language: str = None) -> Dict[str, int]:
     """Get count of AI articles by AI topic."""
     try:
-        ai_articles = get_ai_articles_with_content()
+        ai_articles = get_ai_articles_with_content(get_ai_articles_version())
         
         if not ai_articles:
             return {}
         
+        topic_counts = Counter(normalize_ai_topic(article.get('ai_topic')) for article in ai_articles)
+        
         topics = Counter()
-        for article in ai_articles:
-            topic = normalize_ai_topic(article.get('ai_topic'))
-            if topic and topic.lower() != 'other':
-                translated_topic = translate_ai_topic(topic)
-                topics[translated_topic] += 1
+        for topic, count in topic_counts.items():
+            if topic.lower() != 'other':
+                topics[translate_ai_topic(topic)] += count
         
         return dict(topics)
         
@@ -86,16 +87,15 @@ def get_ai_articles_by_category(language: str = None) -> Dict[str, int]:
     """Get count of AI articles by category."""
     try:
         db = get_database()
-        ai_articles = db.get_recent_ai_articles(limit=10000)
+        category_counts = db.get_ai_articles_by_domain_category()
         
-        if not ai_articles:
+        if not category_counts:
             return {}
         
         categories = Counter()
-        for article in ai_articles:
-            category = normalize_domain_category(article.get('domain_category'))
-            translated_category = translate_domain_category(category)
-            categories[translated_category] += 1
+        for category, count in category_counts.items():
+            translated_category = translate_domain_category(normalize_domain_category(category))
+            categories[translated_category] += count
         
         return dict(categories)
         
@@ -103,106 +103,89 @@ def get_ai_articles_by_category(language: str = None) -> Dict[str, int]:
         return {}
 
 
-def get_ai_articles_with_content() -> List[Dict[str, Any]]:
-    """Get AI articles with summaries and metadata from the database."""
-    try:
-        db = get_database()
-        ai_articles = db.get_recent_ai_articles(limit=1000)
+def get_ai_articles_version() -> str:
+    """Get the database token that keys the cached AI article list."""
+    return get_database().get_ai_articles_version()
 
-        if not ai_articles:
-            return []
 
-        articles_with_content: List[Dict[str, Any]] = []
-        for article in ai_articles:
-            summary_en = article.get('summary_en') or 'No AI explanation available'
-            if summary_en.startswith('OpenAI: '):
-                summary_en = summary_en[8:]
+@st.cache_data(ttl=300, show_spinner=False)
+def get_ai_articles_with_content(db_version: str = "") -> List[Dict[str, Any]]:
+    """Get AI articles with summaries and metadata from the database.
 
-            summary_da = article.get('summary_da') or summary_en
-            if summary_da.startswith('OpenAI: '):
-                summary_da = summary_da[8:]
+    Args:
+        db_version: Token from get_ai_articles_version(); a new token forces a reload.
 
-            ai_confidence = article.get('ai_confidence')
-            try:
-                ai_confidence = float(ai_confidence) if ai_confidence is not None else 0.0
-            except (TypeError, ValueError):
-                ai_confidence = 0.0
+    Raises:
+        RuntimeError: If no articles came back although the database reports some,
+            so that a failed read is not cached.
+    """
+    db = get_database()
+    ai_articles = db.get_recent_ai_articles(limit=1000)
 
-            ai_topic = normalize_ai_topic(article.get('ai_topic'))
+    if not ai_articles:
+        if db_version.startswith('0:'):
+            return []
+        raise RuntimeError("Failed to load AI articles from the database")
 
-            ai_keywords = article.get('ai_keywords')
-            if isinstance(ai_keywords, str):
-                try:
-                    ai_keywords = json.loads(ai_keywords)
-                except json.JSONDecodeError:
-                    ai_keywords = []
-            if not isinstance(ai_keywords, list):
-                ai_keywords = []
+    articles_with_content: List[Dict[str, Any]] = []
+    for article in ai_articles:
+        summary_en = article.get('summary_en') or 'No AI explanation available'
+        if summary_en.startswith('OpenAI: '):
+            summary_en = summary_en[8:]
 
-            articles_with_content.append({
-                'title': article.get('title', 'No title'),
-                'summary_en': summary_en,
-                'summary_da': summary_da,
-                'url': article.get('url', ''),
-                'domain': article.get('domain', 'Unknown'),
-                'published_date': article.get('published_at', ''),
-                'processed_at': article.get('processed_at', ''),
-                'language': article.get('language', 'Unknown'),
-                'domain_category': normalize_domain_category(article.get('domain_category')),
-                'ai_topic': ai_topic,
-                'ai_confidence': ai_confidence,
-                'ai_keywords': ai_keywords,
-            })
+        summary_da = article.get('summary_da') or summary_en
+        if summary_da.startswith('OpenAI: '):
+            summary_da = summary_da[8:]
 
-        # Collapse duplicates that come from a site and its subdomains sharing the
-        # same headline (e.g. cnn.com vs us.cnn.com). Key on base domain + title;
-        # keep the canonical (shortest) domain.
-        deduped: Dict[tuple, Dict[str, Any]] = {}
-        for art in articles_with_content:
-            key = (
-                normalize_base_domain(art.get('domain', '')),
-                (art.get('title', '') or '').strip().lower(),
-            )
-            existing = deduped.get(key)
-            if existing is None or len(str(art.get('domain', ''))) < len(str(existing.get('domain', ''))):
-                deduped[key] = art
-        articles_with_content = list(deduped.values())
+        ai_confidence = article.get('ai_confidence')
+        try:
+            ai_confidence = float(ai_confidence) if ai_confidence is not None else 0.0
+        except (TypeError, ValueError):
+            ai_confidence = 0.0
 
-        articles_with_content.sort(key=lambda x: x.get('processed_at', ''), reverse=True)
-        return articles_with_content
+        ai_topic = normalize_ai_topic(article.get('ai_topic'))
 
-    except Exception as e:
-        st.error(f"Error getting AI articles with content: {str(e)}")
-        return []
+        ai_keywords = article.get('ai_keywords')
+        if isinstance(ai_keywords, str):
+            try:
+                ai_keywords = json.loads(ai_keywords)
+            except json.JSONDecodeError:
+                ai_keywords = []
+        if not isinstance(ai_keywords, list):
+            ai_keywords = []
 
+        articles_with_content.append({
+            'title': article.get('title', 'No title'),
+            'summary_en': summary_en,
+            'summary_da': summary_da,
+            'url': article.get('url', ''),
+            'domain': article.get('domain', 'Unknown'),
+            'published_date': article.get('published_at', ''),
+            'processed_at': article.get('processed_at', ''),
+            'language': article.get('language', 'Unknown'),
+            'domain_category': normalize_domain_category(article.get('domain_category')),
+            'ai_topic': ai_topic,
+            'ai_confidence': ai_confidence,
+            'ai_keywords': ai_keywords,
+        })
+
+    # Collapse duplicates that come from a site and its subdomains sharing the
+    # same headline (e.g. cnn.com vs us.cnn.com). Key on base domain + title;
+    # keep the canonical (shortest) domain.
+    deduped: Dict[tuple, Dict[str, Any]] = {}
+    for art in articles_with_content:
+        key = (
+            normalize_base_domain(art.get('domain', '')),
+            (art.get('title', '') or '').strip().lower(),
+        )
+        existing = deduped.get(key)
+        if existing is None or len(str(art.get('domain', ''))) < len(str(existing.get('domain', ''))):
+            deduped[key] = art
+    articles_with_content = list(deduped.values())
+
+    articles_with_content.sort(key=itemgetter('processed_at'), reverse=True)
+    return articles_with_content
 
-def run_pipeline_simple():
-    """Run pipeline with simple loading indicator."""
-    import subprocess
-    import sys
-    import os
-    from pathlib import Path
-    
-                                                  
-    env = os.environ.copy()
-    env['MAX_ARTICLES'] = '0'                  
-    
-    project_root = Path(__file__).parent
-    
-                      
-    process = subprocess.Popen(
-        [sys.executable, 'main.py', '--once'],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        env=env,
-        cwd=project_root
-    )
-    
-                         
-    stdout, _ = process.communicate()
-    
-    return process.returncode == 0
 
                     
 st.set_page_config(
@@ -213,791 +196,43 @@ st.set_page_config(
 )
 
                                
-st.markdown("""
-<link href="https://fonts.googleapis.com/css2?family=TASA+Orbiter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-<style>
-    /* Main container width - FULL WIDTH */
-    .main .block-container {
-        max-width: none !important;
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-    }
-    
-    /* Alternative approach for container width */
-    .stApp > div:first-child {
-        max-width: none !important;
-        margin: 0;
-    }
-    
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        text-align: center;
-        margin-bottom: 2rem;
-        background: linear-gradient(90deg, #d9e021, #f0f0f0);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    .success-message {
-        background-color: #d4edda;
-        color: #155724;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border: 1px solid #c3e6cb;
-    }
-    .error-message {
-        background-color: #f8d7da;
-        color: #721c24;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border: 1px solid #f5c6cb;
-    }
-    /* Compact buttons (helps pagination) */
-    .stButton > button {
-        padding: 0.25rem 0.5rem;
-        margin: 0 2px;
-    }
-    
-    /* Hide Streamlit header - specific targeting */
-    header[data-testid="stHeader"] {
-        display: none !important;
-    }
-    
-    /* Hide Streamlit toolbar */
-    div[data-testid="stToolbar"] {
-        display: none !important;
-    }
-    
-    /* Hide Streamlit decorations */
-    div[data-testid="stDecoration"] {
-        display: none !important;
-    }
-    
-    /* Prevent font preload warnings */
-    link[rel="preload"][href*="SourceSansVF"] {
-        display: none !important;
-    }
-    
-    /* Global font family for all elements - TASA Orbiter */
-    * {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Ensure font is loaded and applied */
-    @font-face {
-        font-family: 'TASA Orbiter';
-        font-display: swap;
-    }
-    
-    /* Force font application on key elements */
-    body, html {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* More aggressive targeting for Streamlit elements */
-    .stApp,
-    .stApp *,
-    .stApp *::before,
-    .stApp *::after,
-    [data-testid*="st"],
-    [class*="st"],
-    [class*="css"] {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Target specific Streamlit components */
-    .stMarkdown,
-    .stMarkdown *,
-    .stButton,
-    .stButton *,
-    .stSelectbox,
-    .stSelectbox *,
-    .stTextInput,
-    .stTextInput *,
-    .stMetric,
-    .stMetric *,
-    .stContainer,
-    .stContainer *,
-    .stExpander,
-    .stExpander * {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Force TASA Orbiter on introduction text specifically */
-    .stMarkdown div[style*="padding: 20px 0; text-align: center;"] p,
-    .stMarkdown div[style*="padding: 20px 0; text-align: center;"] p *,
-    .stMarkdown div[style*="color: #555; line-height: 1.6; margin: 0; font-size: 1.1em;"] {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Target the specific introduction text container */
-    .stMarkdown div[style*="padding: 20px 0; text-align: center;"] {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    .stMarkdown div[style*="padding: 20px 0; text-align: center;"] * {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Page background - 100% width */
-    .stApp {
-        background-color: #f0f2f6;
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Ensure all text elements use the font */
-    body, html, div, span, p, h1, h2, h3, h4, h5, h6, a, button, input, textarea, select, label, li, ul, ol, table, td, th, tr, caption, legend, fieldset, form, option, optgroup {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Streamlit specific elements */
-    .stApp *, .stApp *::before, .stApp *::after {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Sticky header menu with typeface */
-    .sticky-header {
-        position: fixed !important;
-        top: 0 !important;
-        left: 0 !important;
-        right: 0 !important;
-        height: 60px !important;
-        background: linear-gradient(135deg, #d9e021 0%, #f0f0f0 50%) !important;
-        z-index: 1000 !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: space-between !important;
-        padding: 0 20px !important;
-        box-shadow: 0 2px 6px rgba(0, 0, 0, 0.1) !important;
-        transform: translateY(0) !important;
-        transition: transform 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        will-change: transform !important;
-        visibility: visible !important;
-        opacity: 1 !important;
-    }
-    
-    .sticky-header.hidden {
-        transform: translateY(-100%);
-    }
-    
-    .typeface-logo {
-        height: 22px;
-        opacity: 0.9;
-    }
-    
-    .language-flags {
-        display: flex !important;
-        gap: 15px !important;
-        align-items: center !important;
-    }
-    
-    .flag-link {
-        font-size: 30px !important;
-        text-decoration: none !important;
-        background: transparent !important;
-        border: none !important;
-        cursor: pointer !important;
-        transition: transform 0.2s ease !important;
-        line-height: 1 !important;
-        display: inline-block !important;
-    }
-    
-    .flag-link:hover {
-        transform: scale(1.1) !important;
-        width: auto;
-    }
-    
-    /* Add padding to body to account for sticky header */
-    .stApp {
-        padding-top: 40px;
-    }
-    
-    /* Main background gradient - yellow to light gray */
-    .stMain {
-        background: linear-gradient(135deg, #d9e021 0%, #f0f0f0 50%) !important;
-    }
-    
-    /* Vertical block container - black background with white text */
-    .stVerticalBlock {
-        background-color: #0f0f0f !important;
-        border-radius: 15px !important;
-        color: white !important;
-        padding: 15px !important;
-    }
-    .st-emotion-cache-wfksaw{
-        gap: 0 !important;
-    }
-    
-    /* Make all text inside stVerticalBlock white */
-    .stVerticalBlock * {
-        color: white !important;
-    }
-    
-    /* Exception: Articles list should use default font, not Halyard Display */
-    .stExpander,
-    .stExpander *,
-    .stExpander .stMarkdown,
-    .stExpander .stMarkdown *,
-    .stExpander .stMarkdown p,
-    .stExpander .stMarkdown strong,
-    .stExpander .stMarkdown h1,
-    .stExpander .stMarkdown h2,
-    .stExpander .stMarkdown h3,
-    .stExpander .stMarkdown h4,
-    .stExpander .stMarkdown h5,
-    .stExpander .stMarkdown h6 {
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    /* Fix article expander text colors - ALL text should be white */
-    .stExpander .stMarkdown p,
-    .stExpander .stMarkdown h1,
-    .stExpander .stMarkdown h2,
-    .stExpander .stMarkdown h3,
-    .stExpander .stMarkdown h4,
-    .stExpander .stMarkdown h5,
-    .stExpander .stMarkdown h6,
-    .stExpander .stMarkdown span,
-    .stExpander .stMarkdown div,
-    .stExpander .stMarkdown strong,
-    .stExpander .stMarkdown b,
-    .stExpander .stMarkdown em,
-    .stExpander .stMarkdown i {
-        color: white !important;
-    }
-    
-    /* Ensure ALL text in article details is white */
-    .stExpander .stMarkdown * {
-        color: white !important;
-    }
-    
-    /* Override any specific targeting that might make text black */
-    .stExpander .stMarkdown strong,
-    .stExpander .stMarkdown b {
-        color: white !important;
-    }
-    
-    /* Hide script containers that take up unnecessary space */
-    .stElementContainer:has(script),
-    .stMarkdown:has(script),
-    .stMarkdownContainer:has(script) {
-        display: none !important;
-        height: 0 !important;
-        margin: 0 !important;
-        padding: 0 !important;
-        overflow: hidden !important;
-    }
-    
-    /* Alternative approach - target by content */
-    .stElementContainer[data-testid="stElementContainer"]:has(script),
-    .stMarkdown[data-testid="stMarkdown"]:has(script) {
-        display: none !important;
-        height: 0 !important;
-        margin: 0 !important;
-        padding: 0 !important;
-        overflow: hidden !important;
-    }
-    
-    /* Smaller font only for article content - more targeted approach */
-    .stVerticalBlock .stMarkdown p {
-        font-size: 1.1em !important;
-        line-height: 1.4 !important;
-        font-family: 'TASA Orbiter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif !important;
-    }
-    
-    .stVerticalBlock .stMarkdown strong {
-        font-size: 0.9em !important;
-    }
-    
-    /* Hide the keyboard_arrow_right text that appears when icons don't load */
-    .st-emotion-cache-zkd0x0 {
-        font-size: 0 !important;
-        visibility: hidden !important;
-    }
-    
-    /* Ensure the actual plus icon is visible */
-    .st-emotion-cache-zkd0x0::before {
-        content: "+" !important;
-        font-size: 16px !important;
-        visibility: visible !important;
-        display: inline-block !important;
-    }
-    
-    /* Increase font size of article expander titles (the clickable header) */
-    .stExpander summary,
-    .stExpander details summary,
-    [data-testid="stExpander"] summary,
-    [data-testid="stExpander"] details summary {
-        font-size: 1.3em !important;
-    }
-    
-    /* Target all possible Streamlit expander header classes */
-    .st-emotion-cache-1xarl8l,
-    .st-emotion-cache-1xarl8l p,
-    [data-testid="stExpander"] > details > summary,
-    [data-testid="stExpander"] > details > summary > div,
-    [data-testid="stExpander"] > details > summary > div > p {
-        font-size: 1.3em !important;
-    }
-    
-    /* Target by attribute selector for expander headers */
-    details[open] > summary,
-    details:not([open]) > summary {
-        font-size: 1.3em !important;
-    }
-    
-    /* Style for expanded article dropdown details */
-    .stExpander .st-emotion-cache-3n56ur {
-        background: transparent !important;
-        border-radius: 10px !important;
-        margin-top: 10px !important;
-        border: none !important;
-        outline: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* Prevent white background on article title when expanded */
-    .stExpander .stMarkdown,
-    .stExpander .stMarkdownContainer,
-    .stExpander .stMarkdownContainer *,
-    .stExpander .stMarkdown * {
-        background: transparent !important;
-    }
-    
-    /* Specifically target the title area to prevent white background */
-    .stExpander .stMarkdown strong,
-    .stExpander .stMarkdown b,
-    .stExpander .stMarkdown h1,
-    .stExpander .stMarkdown h2,
-    .stExpander .stMarkdown h3,
-    .stExpander .stMarkdown h4,
-    .stExpander .stMarkdown h5,
-    .stExpander .stMarkdown h6 {
-        background: transparent !important;
-    }
-    
-    /* Target the specific Streamlit class - change white to very dark grey */
-    .st-emotion-cache-1tw2ey4 {
-        background-color: #495057 !important;
-    }
-    
-    /* Also target any similar classes that might have white backgrounds */
-    .stExpander .st-emotion-cache-1tw2ey4,
-    .stExpander [class*="st-emotion-cache-1tw2ey4"] {
-        background-color: #495057 !important;
-    }
-    
-    
-    /* Remove any borders from expander content - more aggressive targeting */
-    .stExpander,
-    .stExpander *,
-    .stExpander .stMarkdown,
-    .stExpander .stMarkdownContainer,
-    .stExpander .stMarkdownContainer *,
-    .stExpander .stMarkdown *,
-    .stExpander div,
-    .stExpander div * {
-        border: none !important;
-        outline: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* Remove focus borders and outlines */
-    .stExpander:focus,
-    .stExpander:focus-within,
-    .stExpander .stMarkdown:focus,
-    .stExpander .stMarkdownContainer:focus,
-    .stExpander div:focus,
-    .stExpander div:focus-within {
-        border: none !important;
-        outline: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* Target specific Streamlit expander classes that might have borders */
-    .stExpander [class*="st-emotion-cache"],
-    .stExpander [class*="st-emotion-cache"] * {
-        border: none !important;
-        outline: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* Remove any left border specifically */
-    .stExpander .stMarkdown,
-    .stExpander .stMarkdownContainer,
-    .stExpander .stMarkdownContainer *,
-    .stExpander div[class*="st-emotion-cache"] {
-        border-left: none !important;
-        border-right: none !important;
-        border-top: none !important;
-        border-bottom: none !important;
-    }
-    
-    /* Make text black in expanded article details */
-    .stExpander .st-emotion-cache-3n56ur * {
-        color: black !important;
-    }
-    
-    /* Ensure links are visible in expanded content */
-    .stExpander .st-emotion-cache-3n56ur a {
-        color: #0066cc !important;
-        text-decoration: underline !important;
-    }
-    
-    .stExpander .st-emotion-cache-3n56ur a:hover {
-        color: #004499 !important;
-    }
-    
-    /* Admin login form input text color - make text black */
-    .stTextInput input,
-    .stTextInput input[type="text"],
-    .stTextInput input[type="password"] {
-        color: black !important;
-    }
-    
-    /* Target Streamlit text input specifically */
-    div[data-testid="stTextInput"] input {
-        color: black !important;
-    }
-    
-    /* Target password input specifically */
-    div[data-testid="stTextInput"] input[type="password"] {
-        color: black !important;
-    }
-    
-    /* Ensure placeholder text is visible but input text is black */
-    .stTextInput input::placeholder {
-        color: #666 !important;
-    }
-    
-    .stTextInput input:focus {
-        color: black !important;
-    }
-    
-    /* Target all form inputs in the admin login area */
-    .stForm .stTextInput input,
-    .stForm .stTextInput input[type="text"],
-    .stForm .stTextInput input[type="password"] {
-        color: black !important;
-    }
-    
-    /* Button styling - white background with black text */
-    .stButton > button,
-    button {
-        background: white !important;
-        color: black !important;
-        border: 1px solid #ddd !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    /* Force black text on all button text elements */
-    .stButton > button *,
-    button *,
-    .stButton > button span,
-    button span {
-        color: black !important;
-    }
-    
-    /* Button hover effect */
-    .stButton > button:hover:not(:disabled),
-    button:hover:not(:disabled) {
-        background: #f8f9fa !important;
-        color: black !important;
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.2) !important;
-        border-color: #ccc !important;
-    }
-    
-    /* Force black text on hover */
-    .stButton > button:hover:not(:disabled) *,
-    button:hover:not(:disabled) *,
-    .stButton > button:hover:not(:disabled) span,
-    button:hover:not(:disabled) span {
-        color: black !important;
-    }
-    
-    /* Disabled button styling */
-    .stButton > button:disabled,
-    button:disabled,
-    .stButton > button[disabled],
-    button[disabled] {
-        background: #cccccc !important;
-        color: #666666 !important;
-        cursor: not-allowed !important;
-        opacity: 0.6 !important;
-        transform: none !important;
-        box-shadow: none !important;
-    }
-    
-    /* Force gray text on disabled buttons */
-    .stButton > button:disabled *,
-    button:disabled *,
-    .stButton > button[disabled] *,
-    button[disabled] *,
-    .stButton > button:disabled span,
-    button:disabled span,
-    .stButton > button[disabled] span,
-    button[disabled] span {
-        color: #666666 !important;
-    }
-    
-    /* Disabled button hover - no effect */
-    .stButton > button:disabled:hover,
-    button:disabled:hover,
-    .stButton > button[disabled]:hover,
-    button[disabled]:hover {
-        background: #cccccc !important;
-        color: #666666 !important;
-        transform: none !important;
-        box-shadow: none !important;
-    }
-    .stHeading {
-        margin-top: 10px !important;
-        margin-bottom: 10px !important;
-    }
-    
-    /* Make pagination buttons wider */
-    .stButton > button[data-testid="baseButton-secondary"],
-    button[data-testid="baseButton-secondary"] {
-        min-width: 120px !important;
-        padding: 8px 16px !important;
-        background: white !important;
-        border: 1px solid #ddd !important;
-        color: black !important;
-    }
-    
-    /* Target all buttons in the pagination area */
-    .stButton > button {
-        min-width: 85px !important;
-        padding: 10px 20px !important;
-        white-space: nowrap !important;
-        background: white !important;
-        border: 1px solid #ddd !important;
-        color: black !important;
-    }
-    
-    /* Specific targeting for pagination buttons */
-    div[data-testid="column"] button {
-        min-width: 100px !important;
-        padding: 10px 20px !important;
-        white-space: nowrap !important;
-        margin: 0 10px !important;
-        background: white !important;
-        border: 1px solid #ddd !important;
-        color: black !important;
-    }
-    
-    /* Add spacing between pagination button columns */
-    div[data-testid="column"] {
-        margin: 0 5px !important;
-    }
-    
-    /* Center the pagination buttons container */
-    div[data-testid="column"]:has(button) {
-        display: flex !important;
-        justify-content: center !important;
-        gap: 16px !important;
-    }
-    
-    /* Alternative approach - target the specific pagination area */
-    .stContainer > div[data-testid="column"] {
-        margin: 0 8px !important;
-    }
-    
-    /* Style horizontal separators (hr elements) */
-    hr {
-        border: none !important;
-        height: 3px !important;
-        background: linear-gradient(270deg, #d9e021 0%, #f0f0f0 100%) !important;
-        margin: 20px 0 !important;
-    }
-    
-    /* Target Streamlit markdown separators */
-    .stMarkdown hr {
-        border: none !important;
-        height: 3px !important;
-        background: linear-gradient(270deg, #d9e021 0%, #f0f0f0 100%) !important;
-        margin: 20px 0 !important;
-    }
-    
-    /* Fix refresh charts button text color - more aggressive targeting */
-    .stButton > button,
-    .stButton > button *,
-    .stButton > button span {
-        color: black !important;
-    }
-    
-    /* Force white background on all Streamlit button types */
-    .stButton > button[data-testid="baseButton-primary"],
-    .stButton > button[data-testid="baseButton-secondary"],
-    button[data-testid="baseButton-primary"],
-    button[data-testid="baseButton-secondary"] {
-        background: white !important;
-        border: 1px solid #ddd !important;
-        color: black !important;
-    }
-    
-    /* Force white background on all button variants */
-    .stButton > button[type="primary"],
-    .stButton > button[type="secondary"],
-    button[type="primary"],
-    button[type="secondary"] {
-        background: white !important;
-        border: 1px solid #ddd !important;
-        color: black !important;
-    }
-    
-    /* Fix select time period input text color - comprehensive targeting */
-    .stSelectbox,
-    .stSelectbox *,
-    .stSelectbox label,
-    .stSelectbox input,
-    .stSelectbox div,
-    .stSelectbox span {
-        color: black !important;
-    }
-    
-    /* Target all form elements */
-    .stForm,
-    .stForm *,
-    .stForm label,
-    .stForm input,
-    .stForm div,
-    .stForm span {
-        color: black !important;
-    }
-    
-    /* Force black text on all interactive elements */
-    .stApp [data-testid="stSelectbox"] *,
-    .stApp [data-testid="stButton"] * {
-        color: black !important;
-    }
-    
-    /* Make Plotly chart corners rounder */
-    .stPlotlyChart,
-    .js-plotly-plot,
-    .plot-container.plotly,
-    .main-svg {
-        border-radius: 15px !important;
-    }
-    
-    /* Yellow gradient border for specific class */
-    .st-emotion-cache-1n6tfoc {
-        border: 3px solid #f0f0f0 !important;
-        border-radius: 10px !important;
-    }
-    
-    
-    /* Main content container - simple styling */
-    .main .block-container {
-        background-color: white;
-        border-radius: 10px;
-        box-shadow: 0 2px 10px rgba(0, 0, 0, 0.1);
-        padding: 2rem;
-        margin: 1rem auto;
-        position: relative !important;
-    }
-    
-    /* Footer styling */
-    .footer-container {
-        background-color: #f8f9fa;
-        border-top: 1px solid #dee2e6;
-        padding: 1rem 0;
-    }
-    
-    /* Smooth animation for intro content */
-        @keyframes slideDown {
-            from { 
-                opacity: 0; 
-                transform: translateY(-20px); 
-            }
-            to { 
-                opacity: 1; 
-                transform: translateY(0); 
-            }
-        }
-    
-    /* Language selector styling */
-    .stButton > button {
-        font-size: 18px !important;
-        padding: 8px 12px !important;
-        min-height: 40px !important;
-        border-radius: 8px !important;
-        transition: all 0.2s ease !important;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1) !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 8px rgba(0,0,0,0.15) !important;
-    }
-    
-    /* Compact language selector buttons */
-    [data-testid="stButton"]:has(button[title="English"]),
-    [data-testid="stButton"]:has(button[title="Dansk"]) {
-        margin: 0 !important;
-    }
-    
-    [data-testid="stButton"]:has(button[title="English"]) button,
-    [data-testid="stButton"]:has(button[title="Dansk"]) button,
-    button[title="English"],
-    button[title="Dansk"] {
-        font-size: 30px !important;
-        line-height: 1 !important;
-        padding: 6px 10px !important;
-        min-height: 36px !important;
-        width: 50px !important;
-    }
-    
-    /* Additional selector for button text content */
-    [data-testid="stButton"]:has(button[title="English"]) button > *,
-    [data-testid="stButton"]:has(button[title="Dansk"]) button > *,
-    [data-testid="stButton"]:has(button[title="English"]) button p,
-    [data-testid="stButton"]:has(button[title="Dansk"]) button p,
-    [data-testid="stButton"]:has(button[title="English"]) button div,
-    [data-testid="stButton"]:has(button[title="Dansk"]) button div,
-    button[title="English"] > *,
-    button[title="Dansk"] > *,
-    button[title="English"] p,
-    button[title="Dansk"] p,
-    button[title="English"] div,
-    button[title="Dansk"] div {
-        font-size: 30px !important;
-        line-height: 1 !important;
-    }
-    
-    @keyframes slideUp {
-        from {
-            opacity: 1;
-            transform: translateY(0);
-            max-height: 500px;
-            padding: 20px;
-        }
-        to {
-            opacity: 0;
-            transform: translateY(-20px);
-            max-height: 0;
-            padding: 0 20px;
-        }
-    }
+@st.cache_resource
+def _load_app_css() -> str:
+    """Read the app stylesheet once per server process."""
+    return (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8")
+
+@st.cache_data
+def _load_logo_b64(path: str) -> str:
+    """Read an image once and return it base64-encoded for inline <img> tags."""
+    return base64.b64encode(Path(path).read_bytes()).decode()
+
+st.markdown(
+    '<link href="https://fonts.googleapis.com/css2?family=TASA+Orbiter:wght@300;400;500;600;700&display=swap" rel="stylesheet">\n'
+    f'<style>\n{_load_app_css()}</style>',
+    unsafe_allow_html=True
+)
+
+@st.fragment
+def intro_section():
+    """Read-more toggle for the detailed introduction; reruns on its own."""
+    col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
+    with col_btn2:
+        if st.button(t('read_more'), width='stretch'):
+            st.session_state.intro_expanded = not st.session_state.intro_expanded
     
-    /* Apply animation to intro content */
-    #intro-content {
-        animation: slideDown 0.6s ease-out;
-        overflow: hidden;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+                                                                   
+    if st.session_state.intro_expanded:
+        st.markdown(f"""
+        <div class="intro-expanded-content" style="color: white; width: 100%; margin: 0; padding: 0; background: transparent; border-radius: 10px;">
+            <p style="margin-bottom: 1rem; text-align: left;">
+                {t('detailed_description')}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
 
+@st.fragment
 def admin_login_page():
-    """Admin login page."""
+    """Admin login page; form interactions rerun only this fragment."""
     st.markdown(f'<h1 class="main-header">🔐 {t("admin_login")} - {t("app_title")}</h1>', unsafe_allow_html=True)
     
                 
@@ -1022,7 +257,7 @@ def admin_login_page():
                 # Per-session rate limiting to slow down brute-force attempts
                 max_attempts = 5
                 lockout_seconds = 300
-                now_ts = time.time()
+                now_ts = time.monotonic()
                 locked_until = st.session_state.get('login_locked_until', 0)
 
                 if not admin_credentials_configured():
@@ -1077,7 +312,7 @@ def main():
         st.session_state.language = lang_param
     
                                                          
-    typeface_logo = base64.b64encode(open("images/5. typeface_#0f0f0f.png", "rb").read()).decode()
+    typeface_logo = _load_logo_b64("images/5. typeface_#0f0f0f.png")
     
     # App is served at the subdomain root (aitrendtracker.ai-center.dk/), so links
     # are root-relative. Override with BASE_URL_PATH if deployed under a sub-path.
@@ -1099,7 +334,7 @@ def main():
     
                                                       
     st.markdown('<div style="display:flex; align-items:center; justify-content:center; gap:8px; text-align:center;"><img src="data:image/png;base64,{}" width="70" style="display:block; align-self:center;"><h1 class="main-header" style="margin:0; line-height:1;">{}</h1></div>'.format(
-        base64.b64encode(open("images/2. favicon_#f0f0f0-#d9e021.png", "rb").read()).decode(),
+        _load_logo_b64("images/2. favicon_#f0f0f0-#d9e021.png"),
         t('app_title')
     ), unsafe_allow_html=True)
     
@@ -1117,39 +352,7 @@ def main():
     if 'intro_expanded' not in st.session_state:
         st.session_state.intro_expanded = False
     
-                            
-    col_btn1, col_btn2, col_btn3 = st.columns([1, 1, 1])
-    with col_btn2:
-        if st.button(t('read_more'), width='stretch'):
-            st.session_state.intro_expanded = not st.session_state.intro_expanded
-    
-                                                                   
-    if st.session_state.intro_expanded:
-        st.markdown(f"""
-        <style>
-        @keyframes smoothExpand {{
-            from {{
-                max-height: 0;
-                opacity: 0;
-                transform: translateY(-10px);
-            }}
-            to {{
-                max-height: 1000px;
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        .intro-expanded-content {{
-            animation: smoothExpand 0.5s ease-out forwards;
-            overflow: hidden;
-        }}
-        </style>
-        <div class="intro-expanded-content" style="color: white; width: 100%; margin: 0; padding: 0; background: transparent; border-radius: 10px;">
-            <p style="margin-bottom: 1rem; text-align: left;">
-                {t('detailed_description')}
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+    intro_section()
     
                                   
     if st.session_state.show_login:
@@ -1490,10 +693,14 @@ def main():
     last_update_val = None
     try:
         data_dir = config.storage_dir
-        json_files = list(data_dir.glob("articles_*.json"))
-        if json_files:
-            latest_file = max(json_files, key=lambda p: p.stat().st_mtime)
-            last_update_val = datetime.fromtimestamp(latest_file.stat().st_mtime).isoformat()
+                                                                                         
+        with os.scandir(data_dir) as entries:
+            latest_path = max(
+                (entry.path for entry in entries if entry.name.startswith("articles_") and entry.name.endswith(".json")),
+                default=None
+            )
+        if latest_path:
+            last_update_val = datetime.fromtimestamp(os.stat(latest_path).st_mtime).isoformat()
     except Exception:
         last_update_val = None
     status = {
@@ -1598,7 +805,7 @@ def main():
                                     raise Exception(f"Database not fully cleared! Remaining: {total_after} total, {ai_after} AI articles")
                                 
                                 json_files = list(data_dir.glob("articles_*.json"))
-                                metadata_files = list(data_dir.glob("metadata_*.json"))
+                                metadata_files = list(data_dir.glob("metadata_*.json")) + list(data_dir.glob("manifest_*.json"))
                                 danish_summaries_file = data_dir / "danish_summaries.json"
                                 
                                 deleted_files = 0
@@ -1607,9 +814,10 @@ def main():
                                         file.unlink()
                                         deleted_files += 1
                                 
-                                if danish_summaries_file.exists():
-                                    danish_summaries_file.unlink()
-                                    deleted_files += 1
+                                for summaries_file in (danish_summaries_file, danish_summaries_file.with_suffix(".jsonl")):
+                                    if summaries_file.exists():
+                                        summaries_file.unlink()
+                                        deleted_files += 1
                                 
                                 try:
                                     st.cache_data.clear()
@@ -1699,7 +907,11 @@ def main():
     st.header(f"{t('recent_articles')} ({t('live_updates')})")
     
                                        
-    ai_articles = get_ai_articles_with_content()
+    try:
+        ai_articles = get_ai_articles_with_content(get_ai_articles_version())
+    except Exception as e:
+        st.error(f"Error getting AI articles with content: {str(e)}")
+        ai_articles = []
     
     if ai_articles:
                                                  
@@ -2034,19 +1246,6 @@ def main():
                                                  
     st.markdown('<div class="footer-section">', unsafe_allow_html=True)
     
-                                                 
-    st.markdown("""
-        <style>
-        /* Vertically center footer columns */
-        .footer-section [data-testid="column"] > div[data-testid="stVerticalBlock"] {
-            display: flex !important;
-            flex-direction: column !important;
-            justify-content: center !important;
-            min-height: 100px !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
     footer_col1, footer_col2, footer_col3 = st.columns([1, 1, 1])
 
                         
@@ -2076,7 +1275,7 @@ def main():
                                                               
         current_lang = get_language()
         logo_filename = "images/DMJX_lockup_horisontal_DK_Hvid_RGB.png" if current_lang == 'da' else "images/DMJX_lockup_horisontal_UK_Hvid_RGB.png"
-        dmjx_logo = base64.b64encode(open(logo_filename, "rb").read()).decode()
+        dmjx_logo = _load_logo_b64(logo_filename)
         st.markdown(f"""
         <div style=\"padding: 1rem; display: flex; align-items: center; justify-content: flex-end;\">
             <img src=\"data:image/png;base64,{dmjx_logo}\" width=\"310\" style=\"display: block; flex-shrink: 0;\">
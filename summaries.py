@@ -9,9 +9,8 @@ from __future__ import annotations
 import json
 import os
 import threading
-import time
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from logger import get_logger
 
@@ -52,99 +51,195 @@ def _get_openai_client():
         return _openai_client
 
 
+_cache_line_counts: Dict[Path, int] = {}
+
+
+def summary_cache_key(url: str, english_summary: str) -> str:
+    """Return the key under which a translated summary is cached."""
+    return url or english_summary
+
+
 def load_danish_summary_cache(cache_path: Path) -> Dict[str, str]:
-    """Load cached Danish summaries from disk."""
+    """Load cached Danish summaries from disk.
+
+    The cache is an append-only JSONL file of ``{"key": ..., "summary": ...}``
+    records; later records win. A legacy ``.json`` cache next to it is
+    migrated on first load.
+    """
     if not cache_path.exists():
+        legacy_path = cache_path.with_suffix(".json")
+        if legacy_path != cache_path and legacy_path.exists():
+            try:
+                with legacy_path.open("r", encoding="utf-8") as handle:
+                    cache: Dict[str, str] = json.load(handle)
+                if compact_danish_summary_cache(cache_path, cache):
+                    legacy_path.unlink()
+                    logger.info(f"Migrated {len(cache)} Danish summaries to {cache_path}")
+                return cache
+            except Exception as exc:  # pragma: no cover - defensive path
+                logger.warning(f"Failed to migrate Danish summary cache {legacy_path}: {exc}")
         return {}
 
+    cache = {}
+    line_count = 0
     try:
         with cache_path.open("r", encoding="utf-8") as handle:
-            cache: Dict[str, str] = json.load(handle)
-            return cache
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                line_count += 1
+                try:
+                    record = json.loads(line)
+                    cache[record["key"]] = record["summary"]
+                except (ValueError, KeyError, TypeError):
+                    logger.debug(f"Skipping malformed Danish summary cache line in {cache_path}")
     except Exception as exc:  # pragma: no cover - defensive path
         logger.warning(f"Failed to load Danish summary cache {cache_path}: {exc}")
         return {}
 
+    _cache_line_counts[cache_path] = line_count
+    return cache
+
+
+def compact_danish_summary_cache(cache_path: Path, cache: Dict[str, str]) -> bool:
+    """Rewrite the cache file with one record per live entry.
 
-def save_danish_summary_cache(cache_path: Path, cache: Dict[str, str]) -> None:
-    """Persist Danish summary cache to disk."""
+    Returns True once the new file is in place, False if writing it failed.
+    """
     try:
         cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with cache_path.open("w", encoding="utf-8") as handle:
-            json.dump(cache, handle, ensure_ascii=False, indent=2)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for key, summary in cache.items():
+                handle.write(json.dumps({"key": key, "summary": summary}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, cache_path)
+        _cache_line_counts[cache_path] = len(cache)
+        return True
+    except Exception as exc:  # pragma: no cover - defensive path
+        logger.warning(f"Failed to compact Danish summary cache {cache_path}: {exc}")
+        return False
+
+
+def append_danish_summary_entries(
+    cache_path: Path,
+    entries: Dict[str, str],
+    cache: Dict[str, str],
+) -> None:
+    """
+    Append new or changed summaries to the cache file.
+
+    The file is compacted once it holds more than twice as many records as
+    there are live entries in ``cache``.
+
+    Args:
+        cache_path: Path of the JSONL cache file.
+        entries: Entries added or changed since the cache was loaded.
+        cache: The full in-memory cache, used for compaction.
+    """
+    if not entries:
+        return
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with cache_path.open("a", encoding="utf-8") as handle:
+            for key, summary in entries.items():
+                handle.write(json.dumps({"key": key, "summary": summary}, ensure_ascii=False) + "\n")
     except Exception as exc:  # pragma: no cover - defensive path
         logger.warning(f"Failed to save Danish summary cache {cache_path}: {exc}")
+        return
+
+    line_count = _cache_line_counts.get(cache_path, 0) + len(entries)
+    _cache_line_counts[cache_path] = line_count
+    if line_count > 2 * len(cache):
+        compact_danish_summary_cache(cache_path, cache)
+
+
+_TRANSLATION_BATCH_SIZE = 20
 
+_TRANSLATION_SYSTEM_PROMPT = (
+    "You are a professional English-to-Danish translator. "
+    "Translate the provided summaries accurately."
+)
 
-def translate_summary_to_danish(
-    english_summary: str,
-    url: str,
+_TRANSLATION_INSTRUCTION = (
+    "Translate each of the following numbered English article summaries to Danish. "
+    "Maintain the original meaning, tone, and nuances. Return strict JSON mapping "
+    "each number to its Danish translation, e.g. {\"1\": \"...\", \"2\": \"...\"}.\n\n"
+    "English summaries:\n"
+)
+
+
+def translate_summaries_to_danish(
+    items: List[Tuple[str, str]],
     cache: Dict[str, str],
     *,
     force: bool = False,
-) -> Tuple[str, bool]:
+) -> Dict[str, str]:
     """
-    Translate an English summary to Danish, using cache where possible.
+    Translate English summaries to Danish, using cache where possible.
+
+    Uncached summaries are sent to OpenAI as numbered entries in a single
+    request per batch of ``_TRANSLATION_BATCH_SIZE`` and read back as a JSON
+    object keyed by the same numbers.
 
     Args:
-        english_summary: Summary text in English.
-        url: Article URL used as cache key.
+        items: ``(url, english_summary)`` pairs; URLs are used as cache keys.
         cache: Shared dictionary of cached translations.
-        force: When True, bypass cache and refresh translation.
+        force: When True, bypass cache and refresh translations.
 
     Returns:
-        Tuple[str, bool]: (Danish summary text, cache_updated_flag)
+        Dict[str, str]: Cache entries added or changed by this call.
     """
-    if not english_summary:
-        return "", False
-
-    cache_key = url or english_summary
-
-    if not force and cache_key in cache:
-        return cache[cache_key], False
+    pending: Dict[str, str] = {}
+    for url, english_summary in items:
+        if not english_summary:
+            continue
+        cache_key = summary_cache_key(url, english_summary)
+        if force or cache_key not in cache:
+            pending[cache_key] = english_summary
+
+    if not pending:
+        return {}
 
     client = _get_openai_client()
     if client is None:
-        cache[cache_key] = english_summary
-        return english_summary, True
-
-    prompt = (
-        "Translate the following English article summary to Danish. "
-        "Maintain the original meaning, tone, and nuances.\n\n"
-        f"English summary:\n{english_summary}\n\nDanish translation:"
-    )
-
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini-2024-07-18",
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a professional English-to-Danish translator. "
-                        "Translate the provided summary accurately."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.2,
-            max_tokens=500,
-        )
+        cache.update(pending)
+        return pending
 
-        danish_summary = response.choices[0].message.content.strip()
+    updates: Dict[str, str] = {}
+    pending_items = list(pending.items())
+    for offset in range(0, len(pending_items), _TRANSLATION_BATCH_SIZE):
+        batch = pending_items[offset:offset + _TRANSLATION_BATCH_SIZE]
+        numbered = {str(index): summary for index, (_, summary) in enumerate(batch, 1)}
 
-        if not danish_summary:
-            danish_summary = english_summary
+        prompt = _TRANSLATION_INSTRUCTION + json.dumps(numbered, ensure_ascii=False)
 
-        cache[cache_key] = danish_summary
-
-        time.sleep(0.1)
-
-        return danish_summary, True
+        try:
+            response = client.chat.completions.create(
+                model="gpt-4o-mini-2024-07-18",
+                messages=[
+                    {"role": "system", "content": _TRANSLATION_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt},
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.2,
+                max_tokens=500 * len(batch),
+            )
+
+            translations = json.loads(response.choices[0].message.content or "{}")
+            if not isinstance(translations, dict):
+                translations = {}
 
-    except Exception as exc:
-        logger.warning(f"Failed to translate summary for {url[:80]}: {exc}")
-        cache[cache_key] = english_summary
-        return english_summary, True
+        except Exception as exc:
+            logger.warning(f"Failed to translate batch of {len(batch)} summaries: {exc}")
+            translations = {}
 
+        for index, (cache_key, english_summary) in enumerate(batch, 1):
+            danish_summary = translations.get(str(index))
+            if not isinstance(danish_summary, str) or not danish_summary.strip():
+                danish_summary = english_summary
+            updates[cache_key] = danish_summary.strip()
 
+    cache.update(updates)
+    return updates
@@ -3,6 +3,7 @@ Utility functions for the news scraping service.
 """
 
 import re
+import threading
 import time
 import hashlib
 from typing import Optional
@@ -11,18 +12,49 @@ from urllib.parse import urlparse
 from logger import get_logger
 
 
-def rate_limit(delay_seconds: float, last_request_time: float) -> None:
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-_\.]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class TokenBucket:
     """
-    Apply rate limiting by waiting if necessary.
+    Thread-safe token bucket that allows short bursts up to a fixed rate.
     
-    Args:
-        delay_seconds: Minimum delay between requests
-        last_request_time: Timestamp of last request
+    Tokens refill lazily on each acquire, so an idle bucket costs nothing.
     """
-    elapsed = time.time() - last_request_time
-    if elapsed < delay_seconds:
-        sleep_time = delay_seconds - elapsed
-        time.sleep(sleep_time)
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until one is available.
+        
+        The token is reserved before sleeping, so concurrent callers queue up
+        behind each other instead of all waking at the same moment.
+        
+        Returns:
+            float: Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
 
 
 def sanitize_filename(url: str) -> str:
@@ -40,10 +72,10 @@ def sanitize_filename(url: str) -> str:
     domain = parsed.netloc.lower()
     
                             
-    domain = re.sub(r'^www\.', '', domain)
+    domain = domain.removeprefix('www.')
     
                                                  
-    safe_name = re.sub(r'[^\w\-_\.]', '_', domain)
+    safe_name = _UNSAFE_FILENAME_CHARS_RE.sub('_', domain)
     
     return safe_name
 
@@ -58,7 +90,7 @@ def generate_content_hash(content: str) -> str:
     Returns:
         MD5 hash string
     """
-    return hashlib.md5(content.encode('utf-8')).hexdigest()
+    return hashlib.md5(content.encode('utf-8'), usedforsecurity=False).hexdigest()
 
 
 def format_duration(seconds: float) -> str:
@@ -93,7 +125,7 @@ def normalize_text(text: Optional[str]) -> Optional[str]:
         return None
     
                                                        
-    normalized = re.sub(r'\s+', ' ', text.strip())
+    normalized = _WHITESPACE_RE.sub(' ', text.strip())
     return normalized
 
 